@@ -0,0 +1,119 @@
+"""On-disk cache of parsed track lists for previously analyzed files."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from langfilter.parser import AudioTrack, SubtitleTrack, track_to_dict
+
+# Entries keyed by resolved path; each records the size and mtime it was parsed at
+_entries: dict[str, dict[str, Any]] | None = None
+_dirty = False
+_lock = threading.Lock()
+
+
+def _cache_file() -> Path:
+    """Location of the track cache, honouring XDG_CACHE_HOME."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "langfilter" / "tracks.json"
+
+
+def _load_entries() -> dict[str, dict[str, Any]]:
+    """Return the cache entries, reading the cache file on first use."""
+    global _entries
+    if _entries is None:
+        try:
+            data = json.loads(_cache_file().read_text())
+        except (OSError, ValueError):
+            data = {}
+        _entries = data if isinstance(data, dict) else {}
+    return _entries
+
+
+def file_stamp(stat: os.stat_result) -> str:
+    """Size and modification time of a file, used to detect changes since it was read."""
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _key_and_stamp(filename: Path, stat: os.stat_result | None) -> tuple[str, str]:
+    """Return (cache key, stamp) for a file, statting it unless given."""
+    if stat is None:
+        stat = filename.stat()
+    return str(filename.resolve()), file_stamp(stat)
+
+
+def get_cached_tracks(
+    filename: Path, stat: os.stat_result | None = None
+) -> tuple[list[AudioTrack], list[SubtitleTrack]] | None:
+    """
+    Look up the tracks of a file parsed by an earlier run.
+
+    Pass the file's stat result if the caller already has it. Returns None if the
+    file is not cached or has changed since it was parsed.
+    """
+    try:
+        key, stamp = _key_and_stamp(filename, stat)
+    except OSError:
+        return None
+
+    with _lock:
+        entry = _load_entries().get(key)
+    if not isinstance(entry, dict) or entry.get("stamp") != stamp:
+        return None
+
+    try:
+        audio_tracks = [AudioTrack(**track) for track in entry["audio"]]
+        subtitle_tracks = [SubtitleTrack(**track) for track in entry["subtitles"]]
+    except (KeyError, TypeError):
+        # Written by a version with different track fields
+        return None
+    return audio_tracks, subtitle_tracks
+
+
+def store_tracks(
+    filename: Path,
+    audio_tracks: list[AudioTrack],
+    subtitle_tracks: list[SubtitleTrack],
+    stat: os.stat_result | None = None,
+) -> None:
+    """Remember the parsed tracks of a file. Call save_track_cache() to persist."""
+    global _dirty
+    try:
+        key, stamp = _key_and_stamp(filename, stat)
+    except OSError:
+        return
+
+    with _lock:
+        _load_entries()[key] = {
+            "stamp": stamp,
+            "audio": [track_to_dict(track) for track in audio_tracks],
+            "subtitles": [track_to_dict(track) for track in subtitle_tracks],
+        }
+        _dirty = True
+
+
+def save_track_cache() -> None:
+    """
+    Write the cache back to disk if anything was added. Failures are ignored.
+
+    The cache is written to a temporary file and moved into place, so an interrupted
+    write or a concurrent run never leaves a truncated cache behind.
+    """
+    global _dirty
+    with _lock:
+        if not _dirty or _entries is None:
+            return
+        cache_file = _cache_file()
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(json.dumps(_entries))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            tmp_file.unlink(missing_ok=True)
+            return
+        _dirty = False
@@ -2,20 +2,131 @@
 
 from __future__ import annotations
 
-import configparser
+import re
+import sys
+from collections.abc import Sequence, Set
 from pathlib import Path
 
 from langfilter.parser import AudioTrack, SubtitleTrack
 
+_SECTION_RE = re.compile(r"^\[([^\]]+)\]\s*$")
+_KV_RE = re.compile(r"^([^=:\s][^=:]*?)\s*[:=]\s*(.*?)\s*$")
+
+# Section whose values every other section inherits, as in configparser
+_DEFAULT_SECTION = "DEFAULT"
+
+
+def _read_ini(config_path: Path) -> dict[str, dict[str, str]]:
+    """
+    Read the simple INI layout used by langfilter configs.
+
+    Handles sections, `key = value` / `key: value` pairs, full-line `#` and `;`
+    comments and indented continuation lines. Keys are lowercased like configparser
+    does. This avoids configparser's overhead for our handful of known keys.
+
+    Otherwise behaves as configparser does for these files: `[DEFAULT]` values are
+    inherited by every other section and `[DEFAULT]` itself is not returned as a
+    section, and a repeated section or a repeated key within a section raises
+    ValueError.
+    """
+    sections: dict[str, dict[str, str]] = {}
+    defaults: dict[str, str] = {}
+    current: dict[str, str] | None = None
+    current_name = ""
+    last_key: str | None = None
+
+    for raw_line in config_path.read_text().splitlines():
+        line = raw_line.strip()
+        if not line or line[0] in "#;":
+            continue
+
+        # Indented line continues the previous value
+        if raw_line[0].isspace() and current is not None and last_key is not None:
+            current[last_key] += "\n" + line
+            continue
+
+        if match := _SECTION_RE.match(line):
+            current_name = match.group(1)
+            if current_name == _DEFAULT_SECTION:
+                current = defaults
+            elif current_name in sections:
+                raise ValueError(f"{config_path}: duplicate section [{current_name}]")
+            else:
+                current = sections[current_name] = {}
+            last_key = None
+        elif match := _KV_RE.match(line):
+            if current is None:
+                raise ValueError(f"{config_path}: key outside of a section: {line!r}")
+            last_key = match.group(1).lower()
+            if last_key in current:
+                raise ValueError(f"{config_path}: duplicate key {last_key!r} in [{current_name}]")
+            current[last_key] = match.group(2)
+        else:
+            raise ValueError(f"{config_path}: cannot parse line: {line!r}")
+
+    if defaults:
+        return {name: {**defaults, **values} for name, values in sections.items()}
+    return sections
+
+
+def _parse_lang_set(raw: str) -> frozenset[str]:
+    """Parse a comma-separated language list into a set of lowercased codes."""
+    return frozenset(
+        sys.intern(lang) for lang in (part.strip().lower() for part in raw.split(",")) if lang
+    )
+
+
+def _filter_indices(
+    tracks: Sequence[AudioTrack] | Sequence[SubtitleTrack],
+    keep: Set[str],
+    remove: Set[str],
+) -> set[int]:
+    """
+    Return indices of tracks to remove under the given keep/remove language rules.
+
+    A track is removed if keep rules exist and its language is not kept, or if its
+    language is explicitly removed.
+    """
+    has_keep, has_remove = bool(keep), bool(remove)
+    return {
+        i
+        for i, track in enumerate(tracks)
+        if (
+            (lang := track.norm_language)
+            and ((has_keep and lang not in keep) or (has_remove and lang in remove))
+        )
+    }
+
+
+def _removes_any(
+    tracks: Sequence[AudioTrack] | Sequence[SubtitleTrack],
+    keep: Set[str],
+    remove: Set[str],
+) -> bool:
+    """Whether the keep/remove language rules would remove at least one track."""
+    return any(
+        (keep and lang not in keep) or lang in remove
+        for lang in (track.norm_language for track in tracks)
+    )
+
 
 class LangFilterConfig:
     """Configuration settings for langfilter."""
 
+    __slots__ = (
+        "keep_languages",
+        "remove_languages",
+        "keep_subtitle_languages",
+        "remove_subtitle_languages",
+        "default_audio_language",
+        "default_subtitle_language",
+    )
+
     def __init__(self) -> None:
-        self.keep_languages: set[str] = set()
-        self.remove_languages: set[str] = set()
-        self.keep_subtitle_languages: set[str] = set()
-        self.remove_subtitle_languages: set[str] = set()
+        self.keep_languages: frozenset[str] = frozenset()
+        self.remove_languages: frozenset[str] = frozenset()
+        self.keep_subtitle_languages: frozenset[str] = frozenset()
+        self.remove_subtitle_languages: frozenset[str] = frozenset()
         self.default_audio_language: str | None = None
         self.default_subtitle_language: str | None = None
 
@@ -23,65 +134,29 @@ class LangFilterConfig:
     def load_from_file(cls, config_path: Path) -> LangFilterConfig:
         """Load configuration from INI file."""
         config = cls()
-
-        if not config_path.exists():
+        try:
+            sections = _read_ini(config_path)
+        except FileNotFoundError:
             return config
 
-        parser = configparser.ConfigParser()
-        parser.read(config_path)
+        # Audio section or main section (first section in the file)
+        section_data = sections.get("audio")
+        if section_data is None:
+            section_data = next(iter(sections.values()), {})
 
-        # Audio section or main section
-        if "audio" in parser:
-            section_data = parser["audio"]
-        elif len(parser.sections()) > 0:
-            section_data = parser[parser.sections()[0]]
-        else:
-            section_data = {}
-
-        # Parse keep languages
-        if "keep" in section_data:
-            keep_str = section_data["keep"].strip()
-            if keep_str:
-                config.keep_languages = {
-                    lang.strip().lower() for lang in keep_str.split(",") if lang.strip()
-                }
-
-        # Parse remove languages
-        if "remove" in section_data:
-            remove_str = section_data["remove"].strip()
-            if remove_str:
-                config.remove_languages = {
-                    lang.strip().lower() for lang in remove_str.split(",") if lang.strip()
-                }
-
-        # Parse default track languages
-        if "default_audio" in section_data:
-            default_audio = section_data["default_audio"].strip()
-            if default_audio:
-                config.default_audio_language = default_audio.strip().lower()
-
-        if "default_subtitle" in section_data:
-            default_subtitle = section_data["default_subtitle"].strip()
-            if default_subtitle:
-                config.default_subtitle_language = default_subtitle.strip().lower()
+        # Parse keep and remove languages (the helper strips and drops empty entries)
+        config.keep_languages = _parse_lang_set(section_data.get("keep", ""))
+        config.remove_languages = _parse_lang_set(section_data.get("remove", ""))
+
+        # Parse default track languages (values are already stripped by the reader)
+        config.default_audio_language = section_data.get("default_audio", "").lower() or None
+        config.default_subtitle_language = section_data.get("default_subtitle", "").lower() or None
 
         # Parse subtitle section
-        if "subtitles" in parser:
-            subtitle_section = parser["subtitles"]
-
-            if "keep" in subtitle_section:
-                keep_str = subtitle_section["keep"].strip()
-                if keep_str:
-                    config.keep_subtitle_languages = {
-                        lang.strip().lower() for lang in keep_str.split(",") if lang.strip()
-                    }
-
-            if "remove" in subtitle_section:
-                remove_str = subtitle_section["remove"].strip()
-                if remove_str:
-                    config.remove_subtitle_languages = {
-                        lang.strip().lower() for lang in remove_str.split(",") if lang.strip()
-                    }
+        subtitle_section = sections.get("subtitles")
+        if subtitle_section is not None:
+            config.keep_subtitle_languages = _parse_lang_set(subtitle_section.get("keep", ""))
+            config.remove_subtitle_languages = _parse_lang_set(subtitle_section.get("remove", ""))
 
         return config
 
@@ -91,22 +166,10 @@ class LangFilterConfig:
 
         Returns set of track indices to remove.
         """
-        tracks_to_remove = set()
-
-        for i, track in enumerate(tracks):
-            track_lang = (track.language or "unknown").lower()
-
-            # If we have explicit keep rules, only keep those languages
-            if self.keep_languages:
-                if track_lang not in self.keep_languages:
-                    tracks_to_remove.add(i)
+        if not self.keep_languages and not self.remove_languages:
+            return set()
 
-            # If we have explicit remove rules, remove those languages
-            if self.remove_languages:
-                if track_lang in self.remove_languages:
-                    tracks_to_remove.add(i)
-
-        return tracks_to_remove
+        return _filter_indices(tracks, self.keep_languages, self.remove_languages)
 
     def apply_subtitle_defaults(self, tracks: list[SubtitleTrack]) -> set[int]:
         """
@@ -114,22 +177,20 @@ class LangFilterConfig:
 
         Returns set of track indices to remove.
         """
-        tracks_to_remove = set()
-
-        for i, track in enumerate(tracks):
-            track_lang = (track.language or "unknown").lower()
+        if not self.keep_subtitle_languages and not self.remove_subtitle_languages:
+            return set()
 
-            # If we have explicit keep rules, only keep those languages
-            if self.keep_subtitle_languages:
-                if track_lang not in self.keep_subtitle_languages:
-                    tracks_to_remove.add(i)
+        return _filter_indices(tracks, self.keep_subtitle_languages, self.remove_subtitle_languages)
 
-            # If we have explicit remove rules, remove those languages
-            if self.remove_subtitle_languages:
-                if track_lang in self.remove_subtitle_languages:
-                    tracks_to_remove.add(i)
+    def would_keep_all(self, tracks: list[AudioTrack]) -> bool:
+        """Whether the audio rules keep every track, so filtering would be a no-op."""
+        return not _removes_any(tracks, self.keep_languages, self.remove_languages)
 
-        return tracks_to_remove
+    def would_keep_all_subtitles(self, tracks: list[SubtitleTrack]) -> bool:
+        """Whether the subtitle rules keep every track, so filtering would be a no-op."""
+        return not _removes_any(
+            tracks, self.keep_subtitle_languages, self.remove_subtitle_languages
+        )
 
     def find_default_audio_track(self, tracks: list[AudioTrack]) -> AudioTrack | None:
         """
@@ -141,8 +202,7 @@ class LangFilterConfig:
             return None
 
         for track in tracks:
-            track_lang = (track.language or "unknown").lower()
-            if track_lang == self.default_audio_language:
+            if track.norm_language == self.default_audio_language:
                 return track
 
         return None
@@ -157,8 +217,7 @@ class LangFilterConfig:
             return None
 
         for track in tracks:
-            track_lang = (track.language or "unknown").lower()
-            if track_lang == self.default_subtitle_language:
+            if track.norm_language == self.default_subtitle_language:
                 return track
 
         return None
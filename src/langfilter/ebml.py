@@ -0,0 +1,263 @@
+"""Minimal Matroska (EBML) reader for the track list of an MKV file."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from langfilter.iso639 import ISO_639_1_TO_2B
+
+# Element IDs, with their length marker bits kept as in the Matroska spec
+_EBML_HEADER = 0x1A45DFA3
+_SEGMENT = 0x18538067
+_SEEK_HEAD = 0x114D9B74
+_SEEK = 0x4DBB
+_SEEK_ID = 0x53AB
+_SEEK_POSITION = 0x53AC
+_TRACKS = 0x1654AE6B
+_CLUSTER = 0x1F43B675
+_TRACK_ENTRY = 0xAE
+_TRACK_NUMBER = 0xD7
+_TRACK_TYPE = 0x83
+_NAME = 0x536E
+_LANGUAGE = 0x22B59C
+_LANGUAGE_BCP47 = 0x22B59D
+_CODEC_ID = 0x86
+_AUDIO = 0xE1
+_CHANNELS = 0x9F
+
+TRACK_TYPE_AUDIO = 2
+TRACK_TYPE_SUBTITLE = 0x11
+
+# Matroska default for the channel count, which may be omitted
+_DEFAULT_CHANNELS = 1
+
+# Track lists are a few KB; anything far larger is treated as a damaged file
+_MAX_TRACKS_SIZE = 16 << 20
+# A SeekHead is small, so it's read whole to find Tracks without scanning the segment
+_MAX_SEEK_HEAD_SIZE = 64 << 10
+
+
+class EbmlError(ValueError):
+    """The file is not Matroska, or its track list can't be located or decoded."""
+
+
+@dataclass
+class TrackEntry:
+    """One `TrackEntry` of the `Tracks` element, in file order."""
+
+    number: int
+    track_type: int
+    # None without a Language element; such tracks are shown and matched as unknown
+    language: str | None
+    name: str | None
+    codec_id: str | None
+    channels: int | None
+
+
+def _decode_vint(data: bytes, pos: int, keep_marker: bool) -> tuple[int, int, int]:
+    """
+    Decode an EBML variable-length integer at `pos` in `data`.
+
+    Element IDs keep the length marker bit, sizes drop it. Returns (value, length,
+    position after the integer).
+    """
+    if pos >= len(data):
+        raise EbmlError("unexpected end of data")
+    first = data[pos]
+    if first == 0:
+        raise EbmlError(f"invalid variable-length integer at offset {pos}")
+    length = 9 - first.bit_length()
+    end = pos + length
+    if end > len(data):
+        raise EbmlError("unexpected end of data")
+
+    value = first if keep_marker else first & (0xFF >> length)
+    for byte in data[pos + 1 : end]:
+        value = (value << 8) | byte
+    return value, length, end
+
+
+def _is_unknown_size(size: int, length: int) -> bool:
+    """Whether a decoded size is the reserved "unknown size" value (all bits set)."""
+    return size == (1 << (7 * length)) - 1
+
+
+def _read_element_header(f: BinaryIO) -> tuple[int, int | None]:
+    """
+    Read the element ID and data size at the current file position.
+
+    The file is left at the start of the element's data. A size of None means the
+    element has unknown size.
+    """
+    # An ID is at most 4 bytes and a size at most 8
+    start = f.tell()
+    head = f.read(12)
+    element_id, _, pos = _decode_vint(head, 0, keep_marker=True)
+    size, length, pos = _decode_vint(head, pos, keep_marker=False)
+    f.seek(start + pos)
+    return element_id, None if _is_unknown_size(size, length) else size
+
+
+def _children(data: bytes, start: int, end: int) -> Iterator[tuple[int, int, int]]:
+    """Yield (element ID, data start, data end) for each child element in `data[start:end]`."""
+    pos = start
+    while pos < end:
+        element_id, _, pos = _decode_vint(data, pos, keep_marker=True)
+        size, length, pos = _decode_vint(data, pos, keep_marker=False)
+        if _is_unknown_size(size, length) or pos + size > end:
+            raise EbmlError(f"element 0x{element_id:X} overruns its parent")
+        yield element_id, pos, pos + size
+        pos += size
+
+
+def _uint(data: bytes, start: int, end: int) -> int:
+    return int.from_bytes(data[start:end], "big")
+
+
+def _string(data: bytes, start: int, end: int) -> str:
+    # Strings may be zero-padded to their declared size
+    return data[start:end].rstrip(b"\0").decode("utf-8", errors="replace")
+
+
+def _language_from_bcp47(tag: str) -> str:
+    """
+    Map a LanguageBCP47 tag to the ISO 639-2 code the legacy Language element holds.
+
+    Only the primary language subtag is used. Raises EbmlError for tags without an
+    ISO 639-2 form, so the caller falls back to mkvmerge.
+    """
+    primary = tag.split("-", 1)[0].lower()
+    if len(primary) == 3 and primary.isascii() and primary.isalpha():
+        return primary
+    if (code := ISO_639_1_TO_2B.get(primary)) is not None:
+        return code
+    raise EbmlError(f"unsupported LanguageBCP47 tag {tag!r}")
+
+
+def _parse_track_entry(data: bytes, start: int, end: int) -> TrackEntry:
+    """
+    Decode the children of one `TrackEntry` element.
+
+    LanguageBCP47 takes precedence over Language when both are present, as the
+    Matroska spec requires.
+    """
+    entry = TrackEntry(
+        number=0,
+        track_type=0,
+        language=None,
+        name=None,
+        codec_id=None,
+        channels=None,
+    )
+    bcp47_language = None
+    for element_id, child_start, child_end in _children(data, start, end):
+        if element_id == _TRACK_NUMBER:
+            entry.number = _uint(data, child_start, child_end)
+        elif element_id == _TRACK_TYPE:
+            entry.track_type = _uint(data, child_start, child_end)
+        elif element_id == _LANGUAGE:
+            entry.language = _string(data, child_start, child_end) or None
+        elif element_id == _LANGUAGE_BCP47:
+            bcp47_language = _string(data, child_start, child_end)
+        elif element_id == _NAME:
+            entry.name = _string(data, child_start, child_end) or None
+        elif element_id == _CODEC_ID:
+            entry.codec_id = _string(data, child_start, child_end) or None
+        elif element_id == _AUDIO:
+            entry.channels = _DEFAULT_CHANNELS
+            for audio_id, audio_start, audio_end in _children(data, child_start, child_end):
+                if audio_id == _CHANNELS:
+                    entry.channels = _uint(data, audio_start, audio_end)
+
+    if bcp47_language:
+        entry.language = _language_from_bcp47(bcp47_language)
+    if entry.track_type == TRACK_TYPE_AUDIO and entry.channels is None:
+        entry.channels = _DEFAULT_CHANNELS
+    return entry
+
+
+def _find_tracks_in_seek_head(data: bytes) -> int | None:
+    """Return the segment-relative position of `Tracks` listed in a SeekHead, if any."""
+    for element_id, start, end in _children(data, 0, len(data)):
+        if element_id != _SEEK:
+            continue
+        seek_id = position = None
+        for child_id, child_start, child_end in _children(data, start, end):
+            if child_id == _SEEK_ID:
+                seek_id = _uint(data, child_start, child_end)
+            elif child_id == _SEEK_POSITION:
+                position = _uint(data, child_start, child_end)
+        if seek_id == _TRACKS and position is not None:
+            return position
+    return None
+
+
+def _read_tracks_element(f: BinaryIO) -> bytes:
+    """
+    Position past the EBML header and return the data of the segment's `Tracks` element.
+
+    Top-level elements are skipped by their declared sizes. A SeekHead entry for
+    `Tracks` is followed directly. Reaching the first Cluster without finding
+    `Tracks` is an error rather than a scan through the whole file.
+    """
+    element_id, size = _read_element_header(f)
+    if element_id != _EBML_HEADER or size is None:
+        raise EbmlError("missing EBML header")
+    f.seek(size, os.SEEK_CUR)
+
+    element_id, size = _read_element_header(f)
+    if element_id != _SEGMENT:
+        raise EbmlError("missing Segment element")
+    segment_start = f.tell()
+    segment_end = None if size is None else segment_start + size
+
+    followed_seek_head = False
+    while segment_end is None or f.tell() < segment_end:
+        element_id, size = _read_element_header(f)
+        if element_id == _TRACKS:
+            if size is None or size > _MAX_TRACKS_SIZE:
+                raise EbmlError("Tracks element has an unusable size")
+            data = f.read(size)
+            if len(data) != size:
+                raise EbmlError("truncated Tracks element")
+            return data
+        if size is None:
+            raise EbmlError(f"unknown-size element 0x{element_id:X} before Tracks")
+
+        if element_id == _SEEK_HEAD and size <= _MAX_SEEK_HEAD_SIZE and not followed_seek_head:
+            tracks_position = _find_tracks_in_seek_head(f.read(size))
+            if tracks_position is not None:
+                # Follow only one SeekHead so a bad position can't loop back on itself
+                followed_seek_head = True
+                f.seek(segment_start + tracks_position)
+            continue
+        if element_id == _CLUSTER:
+            raise EbmlError("no Tracks element before the first Cluster")
+        f.seek(size, os.SEEK_CUR)
+
+    raise EbmlError("no Tracks element in Segment")
+
+
+def read_track_entries(mkv_file: Path) -> list[TrackEntry]:
+    """
+    Read the track list of a Matroska file straight from its `Tracks` element.
+
+    Entries are in file order. Raises EbmlError if the file isn't Matroska or the
+    track list can't be decoded, and also if the track numbers aren't 1, 2, 3... in
+    file order: only then is an entry's mkvmerge track ID known to be its number
+    minus one, so other files are left to mkvmerge.
+    """
+    with mkv_file.open("rb") as f:
+        data = _read_tracks_element(f)
+    entries = [
+        _parse_track_entry(data, start, end)
+        for element_id, start, end in _children(data, 0, len(data))
+        if element_id == _TRACK_ENTRY
+    ]
+    if any(entry.number != number for number, entry in enumerate(entries, 1)):
+        raise EbmlError("track numbers don't follow file order")
+    return entries
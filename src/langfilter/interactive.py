@@ -2,8 +2,20 @@
 
 from __future__ import annotations
 
-from langfilter.config import LangFilterConfig
-from langfilter.parser import AudioTrack, SubtitleTrack
+import re
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from langfilter.config import LangFilterConfig
+    from langfilter.parser import AudioTrack, SubtitleTrack
+
+# Same constraints as parser.TrackT, spelled as forward references so that importing
+# this module doesn't load the parser at runtime
+TrackT = TypeVar("TrackT", "AudioTrack", "SubtitleTrack")
 
 
 class UserCancelledError(Exception):
@@ -18,6 +30,58 @@ RESET = "\033[0m"
 BOLD = "\033[1m"
 
 
+class _Command(Enum):
+    """Single-word commands accepted at the selection prompt."""
+
+    QUIT = "quit"
+    NEXT = "next"
+    CLEAR = "clear"
+
+
+_COMMANDS = {
+    "q": _Command.QUIT,
+    "quit": _Command.QUIT,
+    "n": _Command.NEXT,
+    "next": _Command.NEXT,
+    "c": _Command.CLEAR,
+}
+
+_YES_ANSWERS = frozenset({"y", "yes"})
+
+# Fixed messages, formatted once at import
+_MSG_ENTER_COMMAND = f"{YELLOW}Please enter a command or track number(s).{RESET}"
+_MSG_DEFAULT_REMOVED = f"{RED}Cannot set a track marked for removal as default.{RESET}"
+_MSG_SELECTION_UPDATED = f"{GREEN}Selection updated.{RESET}"
+_MSG_CANCELLED = f"\n{YELLOW}Operation cancelled.{RESET}"
+_MSG_NO_RULES = f"{YELLOW}No configuration rules found. Keeping all tracks.{RESET}"
+_MSG_NO_SUBTITLE_RULES = (
+    f"{YELLOW}No subtitle configuration rules found. Keeping all subtitle tracks.{RESET}"
+)
+_DEFAULT_MARKER = f" {GREEN}{BOLD}[DEFAULT]{RESET}"
+
+# Help block shown before each selection prompt
+_HELP_TEXT = (
+    f"\n{BOLD}Commands:{RESET}\n"
+    "  • Enter track number(s) to toggle selection for removal\n"
+    "  • Use ranges: 1-5 selects tracks 1, 2, 3, 4, 5\n"
+    "  • Mix numbers and ranges: 1 3-5 8 selects tracks 1, 3, 4, 5, 8\n"
+    "  • 'd1' to set track 1 as default (use 'dN' for track N)\n"
+    "  • 'n' or 'next' to proceed with current selection\n"
+    "  • 'q' or 'quit' to cancel\n"
+    "  • 'c' to clear all selections\n"
+    "\n"
+)
+
+# One number or range token of a selection such as "1 3-5 8", with surrounding spaces
+_TOKEN_RE = re.compile(r"\s*(\d+)(?:-(\d+))?\s*")
+
+# Track list line templates used by _display_tracks_with_selection
+_REMOVE_LINE = f"  {RED}>{{num:2}}. {{track}}{RESET}"
+_REMOVE_DEFAULT_LINE = f"  {RED}>{{num:2}}. {{track}} [DEFAULT]{RESET}"
+_KEEP_LINE = "   {num:2}. {track}"
+_KEEP_DEFAULT_LINE = f"   {{num:2}}. {GREEN}{BOLD}{{track}} [DEFAULT]{RESET}"
+
+
 def _parse_default_track_selection(input_str: str, max_tracks: int) -> int | None:
     """
     Parse default track selection input (e.g., 'd1' to set track 1 as default).
@@ -27,69 +91,118 @@ def _parse_default_track_selection(input_str: str, max_tracks: int) -> int | Non
     if not input_str.startswith("d"):
         return None
 
+    # isdecimal() screens out ordinary typos without raising; int() can still reject a
+    # pasted number longer than its digit limit
+    number = input_str[1:].strip()
+    if not number.isdecimal():
+        return None
+
     try:
-        track_num = int(input_str[1:])
-        if 1 <= track_num <= max_tracks:
-            return track_num - 1  # Convert to 0-based index
+        track_num = int(number)
     except ValueError:
-        pass
+        return None
+    if 1 <= track_num <= max_tracks:
+        return track_num - 1  # Convert to 0-based index
 
     return None
 
 
-def _parse_track_selection(input_parts: list[str], max_tracks: int) -> tuple[list[int], bool]:
+def _parse_track_selection(input_str: str, max_tracks: int) -> tuple[set[int], bool]:
     """
     Parse track selection input supporting both individual numbers and ranges.
 
     Returns tuple of (track_indices, success).
-    Track indices are 0-based.
+    Track indices are 0-based; repeated numbers are collapsed.
     """
-    indices = []
-
-    for part in input_parts:
-        # Check if it's a range (contains hyphen)
-        if "-" in part:
-            try:
-                start_str, end_str = part.split("-", 1)
-                start = int(start_str.strip())
-                end = int(end_str.strip())
-
-                # Validate range
-                if start < 1 or end < 1 or start > max_tracks or end > max_tracks:
-                    print(
-                        f"{RED}Invalid range: {part}. Numbers must be between 1 and {max_tracks}.{RESET}"
-                    )
-                    return [], False
-
-                if start > end:
-                    print(f"{RED}Invalid range: {part}. Start must be <= end.{RESET}")
-                    return [], False
-
-                # Add all tracks in range (convert to 0-based indices)
-                for track_num in range(start, end + 1):
-                    indices.append(track_num - 1)
-
-            except ValueError:
-                print(f"{RED}Invalid range format: '{part}'. Use format like '1-5'.{RESET}")
-                return [], False
-        else:
+    indices: set[int] = set()
+    pos = 0
+
+    for match in _TOKEN_RE.finditer(input_str):
+        # Tokens must cover the input contiguously; a gap means unparsable text
+        if match.start() != pos:
+            break
+        try:
+            start = int(match[1])
+            end = int(match[2]) if match[2] is not None else None
+        except ValueError:
+            # A number beyond int()'s digit limit; reported as invalid input below
+            break
+        pos = match.end()
+
+        if end is None:
             # Single track number
-            try:
-                track_num = int(part)
-                if 1 <= track_num <= max_tracks:
-                    indices.append(track_num - 1)  # Convert to 0-based index
-                else:
-                    print(
-                        f"{RED}Invalid track number: {part}. Must be between 1 and {max_tracks}.{RESET}"
-                    )
-                    return [], False
-            except ValueError:
-                print(f"{RED}Invalid input: '{part}'. Please enter numbers or ranges.{RESET}")
-                return [], False
+            if not 1 <= start <= max_tracks:
+                print(
+                    f"{RED}Invalid track number: {start}. Must be between 1 and {max_tracks}.{RESET}"
+                )
+                return set(), False
+            indices.add(start - 1)  # Convert to 0-based index
+            continue
+
+        token = match[0].strip()
+
+        # Validate range
+        if start < 1 or end < 1 or start > max_tracks or end > max_tracks:
+            print(
+                f"{RED}Invalid range: {token}. Numbers must be between 1 and {max_tracks}.{RESET}"
+            )
+            return set(), False
+
+        if start > end:
+            print(f"{RED}Invalid range: {token}. Start must be <= end.{RESET}")
+            return set(), False
+
+        # Add all tracks in range (convert to 0-based indices)
+        indices.update(range(start - 1, end))
+
+    if pos != len(input_str) or not indices:
+        print(
+            f"{RED}Invalid input: '{input_str.strip()}'. "
+            f"Please enter numbers or ranges like '1 3-5'.{RESET}"
+        )
+        return set(), False
 
     return indices, True
 
 
+def _split_by_removal(
+    tracks: list[TrackT], tracks_to_remove: set[int]
+) -> tuple[list[TrackT], list[TrackT]]:
+    """Split tracks into (kept, removed) lists in one pass, preserving track order."""
+    kept: list[TrackT] = []
+    removed: list[TrackT] = []
+    for i, track in enumerate(tracks):
+        (removed if i in tracks_to_remove else kept).append(track)
+    return kept, removed
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write a block of output lines with one write and one flush, instead of a print each."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _print_rule_summary(
+    title: str, tracks_to_keep: list[TrackT], removed_tracks: list[TrackT]
+) -> None:
+    """Print the outcome of applying configuration rules as one write."""
+    lines = [
+        title,
+        f"  Tracks to keep: {GREEN}{len(tracks_to_keep)}{RESET}",
+        f"  Tracks to remove: {RED}{len(removed_tracks)}{RESET}",
+    ]
+
+    if tracks_to_keep:
+        lines.append(f"\n{GREEN}Keeping:{RESET}")
+        lines.extend(f"  ✓ {track}" for track in tracks_to_keep)
+
+    if removed_tracks:
+        lines.append(f"\n{RED}Removing:{RESET}")
+        lines.extend(f"  ✗ {track}" for track in removed_tracks)
+
+    _write_lines(lines)
+
+
 def select_subtitle_tracks_non_interactive(
     tracks: list[SubtitleTrack], config: LangFilterConfig
 ) -> list[SubtitleTrack]:
@@ -99,26 +212,16 @@ def select_subtitle_tracks_non_interactive(
     Returns tracks to keep based on config rules.
     """
     if not config.keep_subtitle_languages and not config.remove_subtitle_languages:
-        print(f"{YELLOW}No subtitle configuration rules found. Keeping all subtitle tracks.{RESET}")
+        print(_MSG_NO_SUBTITLE_RULES)
         return tracks
 
     # Apply configuration rules
     tracks_to_remove = config.apply_subtitle_defaults(tracks)
-    tracks_to_keep = [track for i, track in enumerate(tracks) if i not in tracks_to_remove]
-
-    print(f"\n{BOLD}Applied subtitle configuration rules{RESET}")
-    print(f"  Tracks to keep: {GREEN}{len(tracks_to_keep)}{RESET}")
-    print(f"  Tracks to remove: {RED}{len(tracks_to_remove)}{RESET}")
+    tracks_to_keep, removed_tracks = _split_by_removal(tracks, tracks_to_remove)
 
-    if tracks_to_keep:
-        print(f"\n{GREEN}Keeping:{RESET}")
-        for track in tracks_to_keep:
-            print(f"  ✓ {track}")
-
-    if tracks_to_remove:
-        print(f"\n{RED}Removing:{RESET}")
-        for i in sorted(tracks_to_remove):
-            print(f"  ✗ {tracks[i]}")
+    _print_rule_summary(
+        f"\n{BOLD}Applied subtitle configuration rules{RESET}", tracks_to_keep, removed_tracks
+    )
 
     return tracks_to_keep
 
@@ -132,28 +235,59 @@ def select_tracks_non_interactive(
     Returns tracks to keep based on config rules.
     """
     if not config.has_rules():
-        print(f"{YELLOW}No configuration rules found. Keeping all tracks.{RESET}")
+        print(_MSG_NO_RULES)
         return tracks
 
     # Apply configuration rules
     tracks_to_remove = config.apply_defaults(tracks)
-    tracks_to_keep = [track for i, track in enumerate(tracks) if i not in tracks_to_remove]
+    tracks_to_keep, removed_tracks = _split_by_removal(tracks, tracks_to_remove)
 
-    print(f"\n{BOLD}Applied configuration rules: {config}{RESET}")
-    print(f"  Tracks to keep: {GREEN}{len(tracks_to_keep)}{RESET}")
-    print(f"  Tracks to remove: {RED}{len(tracks_to_remove)}{RESET}")
+    _print_rule_summary(
+        f"\n{BOLD}Applied configuration rules: {config}{RESET}", tracks_to_keep, removed_tracks
+    )
 
-    if tracks_to_keep:
-        print(f"\n{GREEN}Keeping:{RESET}")
-        for track in tracks_to_keep:
-            print(f"  ✓ {track}")
+    return tracks_to_keep
 
-    if tracks_to_remove:
-        print(f"\n{RED}Removing:{RESET}")
-        for i in sorted(tracks_to_remove):
-            print(f"  ✗ {tracks[i]}")
 
-    return tracks_to_keep
+@dataclass(frozen=True)
+class _TrackKind(Generic[TrackT]):
+    """Per track type settings for the shared interactive selection loop."""
+
+    label: str
+    has_rules: Callable[[LangFilterConfig], bool]
+    apply_rules: Callable[[LangFilterConfig, list[TrackT]], set[int]]
+    applied_message: Callable[[LangFilterConfig], str]
+    find_default: Callable[[LangFilterConfig, list[TrackT]], TrackT | None]
+    summary_title: str
+    # Printed when there are no tracks at all (None prints nothing)
+    empty_message: str | None
+    # Ask for confirmation before removing every track
+    confirm_remove_all: bool
+
+
+_AUDIO_KIND: _TrackKind[AudioTrack] = _TrackKind(
+    label="audio",
+    has_rules=lambda config: config.has_rules(),
+    apply_rules=lambda config, tracks: config.apply_defaults(tracks),
+    applied_message=lambda config: f"Applied default configuration: {config}",
+    find_default=lambda config, tracks: config.find_default_audio_track(tracks),
+    summary_title="Final selection:",
+    empty_message="No audio tracks found in the file.",
+    confirm_remove_all=True,
+)
+
+_SUBTITLE_KIND: _TrackKind[SubtitleTrack] = _TrackKind(
+    label="subtitle",
+    has_rules=lambda config: bool(
+        config.keep_subtitle_languages or config.remove_subtitle_languages
+    ),
+    apply_rules=lambda config, tracks: config.apply_subtitle_defaults(tracks),
+    applied_message=lambda config: "Applied default subtitle configuration",
+    find_default=lambda config, tracks: config.find_default_subtitle_track(tracks),
+    summary_title="Final subtitle selection:",
+    empty_message=None,
+    confirm_remove_all=False,
+)
 
 
 def select_tracks_to_keep(
@@ -166,145 +300,7 @@ def select_tracks_to_keep(
 
     Returns tuple of (tracks_to_keep, default_track_index).
     """
-    if not tracks:
-        print("No audio tracks found in the file.")
-        return [], None
-
-    # Track which tracks are selected for removal (inverse of what we want to keep)
-    tracks_to_remove = set()
-    current_default = default_track_index
-
-    # Apply default configuration if provided
-    if config and config.has_rules():
-        tracks_to_remove = config.apply_defaults(tracks)
-        print(f"\n{YELLOW}Applied default configuration: {config}{RESET}")
-
-    # Set default track from config if available
-    if config and config.default_audio_language:
-        default_track = config.find_default_audio_track(tracks)
-        if default_track:
-            current_default = next(
-                (
-                    i
-                    for i, track in enumerate(tracks)
-                    if track.mkvmerge_id == default_track.mkvmerge_id
-                ),
-                None,
-            )
-
-    print(f"\n{BOLD}Found {len(tracks)} audio track(s):{RESET}")
-    print()
-
-    while True:
-        # Display all tracks with current selection status
-        _display_tracks_with_selection(tracks, tracks_to_remove, current_default)
-
-        print()
-        print(f"{BOLD}Commands:{RESET}")
-        print("  • Enter track number(s) to toggle selection for removal")
-        print("  • Use ranges: 1-5 selects tracks 1, 2, 3, 4, 5")
-        print("  • Mix numbers and ranges: 1 3-5 8 selects tracks 1, 3, 4, 5, 8")
-        print("  • 'd1' to set track 1 as default (use 'dN' for track N)")
-        print("  • 'n' or 'next' to proceed with current selection")
-        print("  • 'q' or 'quit' to cancel")
-        print("  • 'c' to clear all selections")
-        print()
-
-        try:
-            user_input = input("Selection: ").strip().lower()
-
-            if user_input in ("q", "quit"):
-                raise UserCancelledError()
-
-            if user_input in ("n", "next"):
-                break
-
-            if user_input == "c":
-                tracks_to_remove.clear()
-                current_default = None
-                continue
-
-            if not user_input:
-                print(f"{YELLOW}Please enter a command or track number(s).{RESET}")
-                continue
-
-            # Check if it's a default track selection (e.g., 'd1')
-            default_idx = _parse_default_track_selection(user_input, len(tracks))
-            if default_idx is not None:
-                if default_idx in tracks_to_remove:
-                    print(f"{RED}Cannot set a track marked for removal as default.{RESET}")
-                else:
-                    current_default = default_idx
-                    print(f"{GREEN}Track {default_idx + 1} set as default.{RESET}")
-                continue
-
-            # Parse track numbers and ranges
-            input_parts = user_input.split()
-            track_indices, success = _parse_track_selection(input_parts, len(tracks))
-
-            if success and track_indices:
-                # Toggle selection for all parsed indices
-                for index in track_indices:
-                    if index in tracks_to_remove:
-                        tracks_to_remove.remove(index)
-                    else:
-                        tracks_to_remove.add(index)
-                        # If this track was the default, clear default
-                        if index == current_default:
-                            current_default = None
-
-                print(f"{GREEN}Selection updated.{RESET}")
-
-        except KeyboardInterrupt:
-            print(f"\n{YELLOW}Operation cancelled.{RESET}")
-            return [], None
-        except EOFError:
-            print(f"\n{YELLOW}Operation cancelled.{RESET}")
-            return [], None
-
-    # Calculate tracks to keep (inverse of tracks to remove)
-    tracks_to_keep = [track for i, track in enumerate(tracks) if i not in tracks_to_remove]
-
-    if not tracks_to_keep:
-        print(f"{RED}All tracks selected for removal. This would leave no audio tracks.{RESET}")
-        confirm = input("Are you sure you want to continue? (y/N): ").strip().lower()
-        if confirm not in ("y", "yes"):
-            print("Operation cancelled.")
-            return [], None
-
-    # Validate default track is in tracks to keep
-    if current_default is not None and current_default in tracks_to_remove:
-        current_default = None
-
-    # Find default track in tracks_to_keep if it exists
-    default_track_id = None
-    if current_default is not None and current_default < len(tracks):
-        default_track_id = tracks[current_default].mkvmerge_id
-        # Verify it's actually in tracks_to_keep
-        if not any(track.mkvmerge_id == default_track_id for track in tracks_to_keep):
-            default_track_id = None
-
-    # Final selection summary
-    print(f"\n{BOLD}Final selection:{RESET}")
-    print(f"  Tracks to keep: {GREEN}{len(tracks_to_keep)}{RESET}")
-    print(f"  Tracks to remove: {RED}{len(tracks_to_remove)}{RESET}")
-    if default_track_id is not None and current_default is not None:
-        print(f"  Default track: {GREEN}{BOLD}{current_default + 1}{RESET}")
-
-    if tracks_to_keep:
-        print(f"\n{GREEN}Keeping:{RESET}")
-        for track in tracks_to_keep:
-            default_marker = (
-                f" {GREEN}{BOLD}[DEFAULT]{RESET}" if track.mkvmerge_id == default_track_id else ""
-            )
-            print(f"  ✓ {track}{default_marker}")
-
-    if tracks_to_remove:
-        print(f"\n{RED}Removing:{RESET}")
-        for i in sorted(tracks_to_remove):
-            print(f"  ✗ {tracks[i]}")
-
-    return tracks_to_keep, current_default
+    return _select_tracks_interactive(tracks, config, default_track_index, _AUDIO_KIND)
 
 
 def select_subtitle_tracks_to_keep(
@@ -315,9 +311,25 @@ def select_subtitle_tracks_to_keep(
     """
     Interactively ask user which subtitle tracks to keep.
 
+    Returns tuple of (tracks_to_keep, default_track_index).
+    """
+    return _select_tracks_interactive(tracks, config, default_track_index, _SUBTITLE_KIND)
+
+
+def _select_tracks_interactive(
+    tracks: list[TrackT],
+    config: LangFilterConfig | None,
+    default_track_index: int | None,
+    kind: _TrackKind[TrackT],
+) -> tuple[list[TrackT], int | None]:
+    """
+    Interactive selection loop shared by audio and subtitle tracks.
+
     Returns tuple of (tracks_to_keep, default_track_index).
     """
     if not tracks:
+        if kind.empty_message:
+            print(kind.empty_message)
         return [], None
 
     # Track which tracks are selected for removal (inverse of what we want to keep)
@@ -325,157 +337,163 @@ def select_subtitle_tracks_to_keep(
     current_default = default_track_index
 
     # Apply default configuration if provided
-    if config and (config.keep_subtitle_languages or config.remove_subtitle_languages):
-        tracks_to_remove = config.apply_subtitle_defaults(tracks)
-        print(f"\n{YELLOW}Applied default subtitle configuration{RESET}")
+    if config and kind.has_rules(config):
+        tracks_to_remove = kind.apply_rules(config, tracks)
+        print(f"\n{YELLOW}{kind.applied_message(config)}{RESET}")
 
-    # Set default track from config if available
-    if config and config.default_subtitle_language:
-        default_track = config.find_default_subtitle_track(tracks)
+    # Set default track from config if available (None when no default language is set)
+    if config:
+        default_track = kind.find_default(config, tracks)
         if default_track:
-            current_default = next(
-                (
-                    i
-                    for i, track in enumerate(tracks)
-                    if track.mkvmerge_id == default_track.mkvmerge_id
-                ),
-                None,
-            )
+            id_to_index = {track.mkvmerge_id: i for i, track in enumerate(tracks)}
+            current_default = id_to_index.get(default_track.mkvmerge_id)
 
-    print(f"\n{BOLD}Found {len(tracks)} subtitle track(s):{RESET}")
+    n_tracks = len(tracks)
+    # Track display strings are reused by every redraw and the final summary
+    track_strs = [str(track) for track in tracks]
+    print(f"\n{BOLD}Found {n_tracks} {kind.label} track(s):{RESET}")
     print()
 
+    # Redraw the track list only after the selection state changes, not after
+    # invalid or no-op input
+    dirty = True
+
     while True:
-        # Display all tracks with current selection status
-        _display_tracks_with_selection(tracks, tracks_to_remove, current_default)
-
-        print()
-        print(f"{BOLD}Commands:{RESET}")
-        print("  • Enter track number(s) to toggle selection for removal")
-        print("  • Use ranges: 1-5 selects tracks 1, 2, 3, 4, 5")
-        print("  • Mix numbers and ranges: 1 3-5 8 selects tracks 1, 3, 4, 5, 8")
-        print("  • 'd1' to set track 1 as default (use 'dN' for track N)")
-        print("  • 'n' or 'next' to proceed with current selection")
-        print("  • 'q' or 'quit' to cancel")
-        print("  • 'c' to clear all selections")
-        print()
+        if dirty:
+            # Display all tracks with current selection status
+            _display_tracks_with_selection(track_strs, tracks_to_remove, current_default)
+            sys.stdout.write(_HELP_TEXT)
+            dirty = False
 
         try:
             user_input = input("Selection: ").strip().lower()
+        except (KeyboardInterrupt, EOFError):
+            print(_MSG_CANCELLED)
+            return [], None
 
-            if user_input in ("q", "quit"):
-                raise UserCancelledError()
-
-            if user_input in ("n", "next"):
-                break
-
-            if user_input == "c":
-                tracks_to_remove.clear()
+        command = _COMMANDS.get(user_input)
+
+        if command is _Command.QUIT:
+            raise UserCancelledError()
+
+        if command is _Command.NEXT:
+            break
+
+        if command is _Command.CLEAR:
+            tracks_to_remove.clear()
+            current_default = None
+            dirty = True
+            continue
+
+        if not user_input:
+            print(_MSG_ENTER_COMMAND)
+            continue
+
+        # Check if it's a default track selection (e.g., 'd1')
+        default_idx = _parse_default_track_selection(user_input, n_tracks)
+        if default_idx is not None:
+            if default_idx in tracks_to_remove:
+                print(_MSG_DEFAULT_REMOVED)
+            else:
+                current_default = default_idx
+                dirty = True
+                print(f"{GREEN}Track {default_idx + 1} set as default.{RESET}")
+            continue
+
+        # Parse track numbers and ranges
+        track_indices, success = _parse_track_selection(user_input, n_tracks)
+
+        if success and track_indices:
+            # Toggle selection for all parsed indices
+            tracks_to_remove ^= track_indices
+            # If the default track was just marked for removal, clear default
+            if current_default in track_indices and current_default in tracks_to_remove:
                 current_default = None
-                continue
-
-            if not user_input:
-                print(f"{YELLOW}Please enter a command or track number(s).{RESET}")
-                continue
-
-            # Check if it's a default track selection (e.g., 'd1')
-            default_idx = _parse_default_track_selection(user_input, len(tracks))
-            if default_idx is not None:
-                if default_idx in tracks_to_remove:
-                    print(f"{RED}Cannot set a track marked for removal as default.{RESET}")
-                else:
-                    current_default = default_idx
-                    print(f"{GREEN}Track {default_idx + 1} set as default.{RESET}")
-                continue
-
-            # Parse track numbers and ranges
-            input_parts = user_input.split()
-            track_indices, success = _parse_track_selection(input_parts, len(tracks))
-
-            if success and track_indices:
-                # Toggle selection for all parsed indices
-                for index in track_indices:
-                    if index in tracks_to_remove:
-                        tracks_to_remove.remove(index)
-                    else:
-                        tracks_to_remove.add(index)
-                        # If this track was the default, clear default
-                        if index == current_default:
-                            current_default = None
-
-                print(f"{GREEN}Selection updated.{RESET}")
-
-        except KeyboardInterrupt:
-            print(f"\n{YELLOW}Operation cancelled.{RESET}")
-            return [], None
-        except EOFError:
-            print(f"\n{YELLOW}Operation cancelled.{RESET}")
-            return [], None
+
+            dirty = True
+            print(_MSG_SELECTION_UPDATED)
 
     # Calculate tracks to keep (inverse of tracks to remove)
     tracks_to_keep = [track for i, track in enumerate(tracks) if i not in tracks_to_remove]
 
+    if not tracks_to_keep and kind.confirm_remove_all:
+        print(
+            f"{RED}All tracks selected for removal. This would leave no {kind.label} tracks.{RESET}"
+        )
+        confirm = input("Are you sure you want to continue? (y/N): ").strip().lower()
+        if confirm not in _YES_ANSWERS:
+            print("Operation cancelled.")
+            return [], None
+
     # Validate default track is in tracks to keep
     if current_default is not None and current_default in tracks_to_remove:
         current_default = None
 
     # Find default track in tracks_to_keep if it exists
     default_track_id = None
-    if current_default is not None and current_default < len(tracks):
+    if current_default is not None and current_default < n_tracks:
         default_track_id = tracks[current_default].mkvmerge_id
         # Verify it's actually in tracks_to_keep
-        if not any(track.mkvmerge_id == default_track_id for track in tracks_to_keep):
+        kept_ids = {track.mkvmerge_id for track in tracks_to_keep}
+        if default_track_id not in kept_ids:
             default_track_id = None
 
     # Final selection summary
-    print(f"\n{BOLD}Final subtitle selection:{RESET}")
-    print(f"  Tracks to keep: {GREEN}{len(tracks_to_keep)}{RESET}")
-    print(f"  Tracks to remove: {RED}{len(tracks_to_remove)}{RESET}")
+    lines = [
+        f"\n{BOLD}{kind.summary_title}{RESET}",
+        f"  Tracks to keep: {GREEN}{len(tracks_to_keep)}{RESET}",
+        f"  Tracks to remove: {RED}{len(tracks_to_remove)}{RESET}",
+    ]
     if default_track_id is not None and current_default is not None:
-        print(f"  Default track: {GREEN}{BOLD}{current_default + 1}{RESET}")
+        lines.append(f"  Default track: {GREEN}{BOLD}{current_default + 1}{RESET}")
 
     if tracks_to_keep:
-        print(f"\n{GREEN}Keeping:{RESET}")
-        for track in tracks_to_keep:
-            default_marker = (
-                f" {GREEN}{BOLD}[DEFAULT]{RESET}" if track.mkvmerge_id == default_track_id else ""
-            )
-            print(f"  ✓ {track}{default_marker}")
+        lines.append(f"\n{GREEN}Keeping:{RESET}")
+        shown_default = current_default if default_track_id is not None else None
+        for i, track_str in enumerate(track_strs):
+            if i not in tracks_to_remove:
+                default_marker = _DEFAULT_MARKER if i == shown_default else ""
+                lines.append(f"  ✓ {track_str}{default_marker}")
 
     if tracks_to_remove:
-        print(f"\n{RED}Removing:{RESET}")
-        for i in sorted(tracks_to_remove):
-            print(f"  ✗ {tracks[i]}")
+        lines.append(f"\n{RED}Removing:{RESET}")
+        lines.extend(
+            f"  ✗ {track_str}" for i, track_str in enumerate(track_strs) if i in tracks_to_remove
+        )
+
+    _write_lines(lines)
 
     return tracks_to_keep, current_default
 
 
 def _display_tracks_with_selection(
-    tracks: list[AudioTrack] | list[SubtitleTrack],
+    track_strs: list[str],
     tracks_to_remove: set[int],
     default_track_index: int | None = None,
 ) -> None:
     """Display tracks with visual indicators for selection status and default track."""
-    for i, track in enumerate(tracks):
-        default_marker = " [DEFAULT]" if i == default_track_index else ""
+    lines = []
+    removed_count = 0
+    for i, track_str in enumerate(track_strs):
         if i in tracks_to_remove:
+            removed_count += 1
             # Track selected for removal - show in red with > marker
-            print(f"  {RED}>{i + 1:2}. {track}{default_marker}{RESET}")
+            template = _REMOVE_DEFAULT_LINE if i == default_track_index else _REMOVE_LINE
         else:
             # Track to keep - show normally
-            default_color = f"{GREEN}{BOLD}" if i == default_track_index else ""
-            default_reset = RESET if i == default_track_index else ""
-            print(f"   {i + 1:2}. {default_color}{track}{default_marker}{default_reset}")
+            template = _KEEP_DEFAULT_LINE if i == default_track_index else _KEEP_LINE
+        lines.append(template.format(num=i + 1, track=track_str))
 
-    removed_count = len(tracks_to_remove)
-    kept_count = len(tracks) - removed_count
+    kept_count = len(track_strs) - removed_count
 
-    print()
-    print(
+    lines.append("")
+    lines.append(
         f"  {GREEN}Tracks to keep: {kept_count}{RESET} | {RED}Tracks to remove: {removed_count}{RESET}"
     )
     if default_track_index is not None:
-        print(f"  {GREEN}{BOLD}Default track: {default_track_index + 1}{RESET}")
+        lines.append(f"  {GREEN}{BOLD}Default track: {default_track_index + 1}{RESET}")
+
+    if removed_count == len(track_strs):
+        lines.append(f"  {RED}{BOLD}⚠ All tracks selected for removal!{RESET}")
 
-    if removed_count == len(tracks):
-        print(f"  {RED}{BOLD}⚠ All tracks selected for removal!{RESET}")
+    _write_lines(lines)
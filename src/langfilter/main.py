@@ -4,11 +4,24 @@
 from __future__ import annotations
 
 import argparse
+import io
+import json
+import os
+import queue
+import stat
 import sys
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager, redirect_stdout
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 from pathlib import Path
+from typing import Any, TextIO
 
+from langfilter.cache import file_stamp, get_cached_tracks, save_track_cache, store_tracks
 from langfilter.config import LangFilterConfig, find_config_file
 from langfilter.interactive import (
     RESET,
@@ -19,8 +32,31 @@ from langfilter.interactive import (
     select_tracks_non_interactive,
     select_tracks_to_keep,
 )
-from langfilter.parser import AudioTrack, SubtitleTrack, get_audio_tracks, get_subtitle_tracks
-from langfilter.processor import remove_unwanted_tracks, replace_original
+from langfilter.parser import (
+    AudioTrack,
+    SubtitleTrack,
+    TrackT,
+    get_all_tracks,
+    track_to_dict,
+)
+from langfilter.processor import output_lock, remove_unwanted_tracks, replace_original
+
+# Phase 2 work item: (filename, audio tracks, subtitle tracks, default audio ID, default
+# subtitle ID), with the defaults already resolved to mkvmerge track IDs
+FileSelection = tuple[Path, list[AudioTrack], list[SubtitleTrack] | None, int | None, int | None]
+
+# A file's track lists and whether they came from the track cache
+LoadedTracks = tuple[list[AudioTrack], list[SubtitleTrack], bool]
+
+# Default --jobs: each mkvmerge mostly keeps one core and the disk busy, so run one
+# file per two cores
+_DEFAULT_JOBS = max(1, (os.cpu_count() or 1) // 2)
+
+# Threads reading track lists ahead of non-interactive analysis
+_READ_AHEAD_WORKERS = min(8, os.cpu_count() or 1)
+
+# Track reads kept in flight per job, so a long file list isn't read all at once
+_READ_AHEAD_PER_JOB = 2
 
 
 class TrackSelectionResult(Enum):
@@ -33,7 +69,7 @@ class TrackSelectionResult(Enum):
     FAILED = "failed"  # Error occurred during analysis
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FileAnalysisResult:
     """Result of analyzing a file for track selection."""
 
@@ -52,8 +88,11 @@ class FileAnalysisResult:
         has_audio_to_process = (
             self.status == TrackSelectionResult.SUCCESS and self.selected_tracks is not None
         )
+        # A selection that keeps every track is skipped rather than remuxed unchanged
         has_subtitle_to_process = (
-            self.selected_subtitle_tracks is not None and len(self.selected_subtitle_tracks) > 0
+            self.status == TrackSelectionResult.SUCCESS
+            and self.selected_subtitle_tracks is not None
+            and len(self.selected_subtitle_tracks) > 0
         )
         return has_audio_to_process or has_subtitle_to_process
 
@@ -74,22 +113,97 @@ class FileAnalysisResult:
         return audio_needs_filtering or subtitle_needs_filtering
 
 
+def _resolve_default(
+    all_tracks: list[TrackT], selected_tracks: list[TrackT], default_index: int | None
+) -> TrackT | None:
+    """
+    Find the selected track for a default chosen interactively.
+
+    The selectors return the default as an index into all_tracks; match it to the
+    selected tracks by mkvmerge ID. Returns None if there is no such track.
+    """
+    if default_index is None or default_index >= len(all_tracks):
+        return None
+    wanted = all_tracks[default_index].mkvmerge_id
+    return next((t for t in selected_tracks if t.mkvmerge_id == wanted), None)
+
+
+# Pipeline queue item: (filename, analysis result), or None once all files are analyzed
+AnalysisItem = tuple[Path, FileAnalysisResult] | None
+
+
+def _load_tracks(filename: Path, file_stat: os.stat_result | None) -> LoadedTracks:
+    """Return the tracks of a file from the track cache, reading and caching them on a miss."""
+    cached = get_cached_tracks(filename, file_stat)
+    if cached is not None:
+        return *cached, True
+    audio_tracks, subtitle_tracks = get_all_tracks(filename)
+    store_tracks(filename, audio_tracks, subtitle_tracks, file_stat)
+    return audio_tracks, subtitle_tracks, False
+
+
+@contextmanager
+def _read_tracks_ahead(
+    files: list[Path], file_stats: dict[Path, os.stat_result], window: int
+) -> Iterator[Iterator[Future[LoadedTracks]]]:
+    """
+    Read the track lists of `files` on worker threads, ahead of their analysis.
+
+    Yields an iterator over the pending reads in file order. At most `window` reads
+    are queued ahead of the one taken last, and the next file is submitted as each
+    read is taken. Reads not yet started are cancelled on exit.
+    """
+    if not files:
+        yield iter(())
+        return
+
+    reader = ThreadPoolExecutor(max_workers=min(_READ_AHEAD_WORKERS, window, len(files)))
+
+    def submit(filename: Path) -> Future[LoadedTracks]:
+        return reader.submit(_load_tracks, filename, file_stats.get(filename))
+
+    def reads() -> Iterator[Future[LoadedTracks]]:
+        upcoming = iter(files)
+        in_flight = deque(submit(filename) for filename in islice(upcoming, window))
+        while in_flight:
+            read = in_flight.popleft()
+            if (filename := next(upcoming, None)) is not None:
+                in_flight.append(submit(filename))
+            yield read
+
+    try:
+        yield reads()
+    finally:
+        reader.shutdown(cancel_futures=True)
+
+
 def analyze_and_select_tracks(
-    filename: Path, config: LangFilterConfig | None, non_interactive: bool = False
+    filename: Path,
+    config: LangFilterConfig | None,
+    non_interactive: bool = False,
+    file_stat: os.stat_result | None = None,
+    read_ahead: Future[LoadedTracks] | None = None,
+    config_has_rules: bool = False,
 ) -> FileAnalysisResult:
     """
     Analyze an MKV file and determine which tracks to keep.
 
-    This function combines track discovery with track selection logic.
+    This function combines track discovery with track selection logic. file_stat,
+    if given, is reused for the track cache lookup instead of statting again.
+    read_ahead, if given, is a pending read of the file's tracks started earlier.
+    config_has_rules tells whether config has keep or remove rules; callers work it
+    out once for the whole run.
     """
-    print(f"\nAnalyzing MKV file: {filename}")
-    print("Running mkvinfo to extract track information...")
-
     try:
-        # Get all audio tracks
-        audio_tracks = get_audio_tracks(filename)
-        # Get all subtitle tracks
-        subtitle_tracks = get_subtitle_tracks(filename)
+        if read_ahead is not None:
+            audio_tracks, subtitle_tracks, from_cache = read_ahead.result()
+        else:
+            audio_tracks, subtitle_tracks, from_cache = _load_tracks(filename, file_stat)
+        # Header and source line go out in one write
+        source = (
+            "Using cached track information..." if from_cache else "Reading track information..."
+        )
+        print(f"\nAnalyzing MKV file: {filename}\n{source}")
 
         if not audio_tracks and not subtitle_tracks:
             print("No audio or subtitle tracks found in the file.")
@@ -101,16 +215,38 @@ def analyze_and_select_tracks(
                 selected_subtitle_tracks=None,
             )
 
+        # The config to select by in non-interactive mode, None if it has no rules
+        rules = config if config_has_rules else None
+
+        # Rules that keep everything make the selectors a no-op, so skip them
+        if (
+            non_interactive
+            and rules is not None
+            and rules.would_keep_all(audio_tracks)
+            and rules.would_keep_all_subtitles(subtitle_tracks)
+        ):
+            print("All tracks selected. No filtering needed for this file.")
+            return FileAnalysisResult(
+                status=TrackSelectionResult.SKIPPED_ALL_SELECTED,
+                all_tracks=audio_tracks,
+                selected_tracks=audio_tracks,
+                all_subtitle_tracks=subtitle_tracks,
+                selected_subtitle_tracks=subtitle_tracks,
+                default_audio_track=rules.find_default_audio_track(audio_tracks),
+                default_subtitle_track=rules.find_default_subtitle_track(subtitle_tracks),
+            )
+
         # Audio track selection (interactive or non-interactive)
         selected_audio_tracks: list[AudioTrack] = []
         default_audio_track: AudioTrack | None = None
-        default_audio_index: int | None = None
 
         if audio_tracks:
             if non_interactive:
-                if config is None or not config.has_rules():
-                    print(f"{YELLOW}Non-interactive mode requires configuration rules.{RESET}")
-                    print("No tracks will be removed. File will be skipped.")
+                if rules is None:
+                    print(
+                        f"{YELLOW}Non-interactive mode requires configuration rules.{RESET}\n"
+                        "No tracks will be removed. File will be skipped."
+                    )
                     return FileAnalysisResult(
                         status=TrackSelectionResult.SKIPPED_NO_SELECTION,
                         all_tracks=audio_tracks,
@@ -118,34 +254,17 @@ def analyze_and_select_tracks(
                         all_subtitle_tracks=subtitle_tracks,
                         selected_subtitle_tracks=None,
                     )
-                selected_audio_tracks = select_tracks_non_interactive(audio_tracks, config)
+                selected_audio_tracks = select_tracks_non_interactive(audio_tracks, rules)
                 # Find default audio track from config
                 if config:
                     default_audio_track = config.find_default_audio_track(selected_audio_tracks)
-                    if default_audio_track:
-                        default_audio_index = next(
-                            (
-                                i
-                                for i, track in enumerate(selected_audio_tracks)
-                                if track.mkvmerge_id == default_audio_track.mkvmerge_id
-                            ),
-                            None,
-                        )
             else:
                 selected_audio_tracks, default_audio_index = select_tracks_to_keep(
                     audio_tracks, config
                 )
-                if default_audio_index is not None and default_audio_index < len(audio_tracks):
-                    # Find the default track in selected tracks by matching mkvmerge_id
-                    original_default_track = audio_tracks[default_audio_index]
-                    default_audio_track = next(
-                        (
-                            track
-                            for track in selected_audio_tracks
-                            if track.mkvmerge_id == original_default_track.mkvmerge_id
-                        ),
-                        None,
-                    )
+                default_audio_track = _resolve_default(
+                    audio_tracks, selected_audio_tracks, default_audio_index
+                )
 
             if not selected_audio_tracks:
                 print("No audio tracks selected. File will be skipped.")
@@ -160,49 +279,31 @@ def analyze_and_select_tracks(
         # Subtitle track selection (interactive or non-interactive)
         selected_subtitle_tracks: list[SubtitleTrack] = []
         default_subtitle_track: SubtitleTrack | None = None
-        default_subtitle_index: int | None = None
 
         if subtitle_tracks:
             if non_interactive:
-                if config is None or not config.has_rules():
-                    print(f"{YELLOW}Non-interactive mode requires configuration rules.{RESET}")
-                    print("No subtitle tracks will be removed. All subtitle tracks will be kept.")
+                if rules is None:
+                    print(
+                        f"{YELLOW}Non-interactive mode requires configuration rules.{RESET}\n"
+                        "No subtitle tracks will be removed. All subtitle tracks will be kept."
+                    )
                     selected_subtitle_tracks = subtitle_tracks
                 else:
                     selected_subtitle_tracks = select_subtitle_tracks_non_interactive(
-                        subtitle_tracks, config
+                        subtitle_tracks, rules
                     )
                 # Find default subtitle track from config
                 if config:
                     default_subtitle_track = config.find_default_subtitle_track(
                         selected_subtitle_tracks
                     )
-                    if default_subtitle_track:
-                        default_subtitle_index = next(
-                            (
-                                i
-                                for i, track in enumerate(selected_subtitle_tracks)
-                                if track.mkvmerge_id == default_subtitle_track.mkvmerge_id
-                            ),
-                            None,
-                        )
             else:
                 selected_subtitle_tracks, default_subtitle_index = select_subtitle_tracks_to_keep(
                     subtitle_tracks, config
                 )
-                if default_subtitle_index is not None and default_subtitle_index < len(
-                    subtitle_tracks
-                ):
-                    # Find the default track in selected tracks by matching mkvmerge_id
-                    original_default_track = subtitle_tracks[default_subtitle_index]
-                    default_subtitle_track = next(
-                        (
-                            track
-                            for track in selected_subtitle_tracks
-                            if track.mkvmerge_id == original_default_track.mkvmerge_id
-                        ),
-                        None,
-                    )
+                default_subtitle_track = _resolve_default(
+                    subtitle_tracks, selected_subtitle_tracks, default_subtitle_index
+                )
 
         # Check if all tracks are selected (no filtering needed)
         audio_all_selected = not audio_tracks or len(selected_audio_tracks) == len(audio_tracks)
@@ -257,23 +358,20 @@ def process_file_with_selection(
     replace_original_file: bool,
     create_backup: bool,
     selected_subtitle_tracks: list[SubtitleTrack] | None = None,
-    default_audio_track: AudioTrack | None = None,
-    default_subtitle_track: SubtitleTrack | None = None,
+    default_audio_track_id: int | None = None,
+    default_subtitle_track_id: int | None = None,
+    nice_level: int = 0,
+    show_progress: bool = False,
 ) -> bool:
     """
     Process a file with predetermined track selection.
 
     Returns success status.
     """
-    print(f"\nProcessing: {filename}")
+    with output_lock:
+        print(f"\nProcessing: {filename}")
 
     try:
-        # Determine default track IDs
-        default_audio_track_id = default_audio_track.mkvmerge_id if default_audio_track else None
-        default_subtitle_track_id = (
-            default_subtitle_track.mkvmerge_id if default_subtitle_track else None
-        )
-
         # Process the file
         filtered_file = remove_unwanted_tracks(
             filename,
@@ -282,20 +380,431 @@ def process_file_with_selection(
             selected_subtitle_tracks,
             default_audio_track_id,
             default_subtitle_track_id,
+            nice_level,
+            show_progress,
         )
 
         # Replace original if requested
         if replace_original_file:
             replace_original(filename, filtered_file, create_backup_file=create_backup)
 
-        print("✔ File processed successfully!")
+        with output_lock:
+            print("✔ File processed successfully!")
         return True
 
     except Exception as e:
-        print(f"✗ Error processing {filename}: {e}", file=sys.stderr)
+        with output_lock:
+            print(f"✗ Error processing {filename}: {e}", file=sys.stderr)
         return False
 
 
+def _process_selected_file(
+    selection: FileSelection,
+    position: str,
+    output_path: Path | None,
+    create_backup: bool,
+    nice_level: int,
+    show_progress: bool,
+) -> bool:
+    """
+    Process one file from the Phase 2 queue, printing its banner first.
+
+    Runs on a worker thread when several jobs are allowed. Returns success status.
+    """
+    (
+        filename,
+        selected_tracks,
+        selected_subtitle_tracks,
+        default_audio_track_id,
+        default_subtitle_track_id,
+    ) = selection
+
+    track_summary_parts = []
+    if selected_tracks:
+        track_summary_parts.append(f"{len(selected_tracks)} audio track(s)")
+    if selected_subtitle_tracks:
+        track_summary_parts.append(f"{len(selected_subtitle_tracks)} subtitle track(s)")
+
+    # Print the banner as one block so parallel workers don't interleave it
+    with output_lock:
+        print(
+            f"\n--- Processing {position}: {filename.name} ---\n"
+            f"Keeping {', '.join(track_summary_parts)}..."
+        )
+
+    return process_file_with_selection(
+        filename,
+        selected_tracks,
+        output_path,
+        True,  # Always replace original file (new default behavior)
+        create_backup,
+        selected_subtitle_tracks,
+        default_audio_track_id,
+        default_subtitle_track_id,
+        nice_level,
+        show_progress,
+    )
+
+
+def _record_analysis(
+    filename: Path,
+    result: FileAnalysisResult,
+    analysis_failed: list[Path],
+) -> FileSelection | None:
+    """Report the analysis outcome of a file, recording it in analysis_failed on failure.
+
+    Returns the Phase 2 work item if the file should be processed.
+    """
+    if result.should_process:
+        selection: FileSelection = (
+            filename,
+            result.selected_tracks or [],
+            result.selected_subtitle_tracks,
+            result.default_audio_track.mkvmerge_id if result.default_audio_track else None,
+            result.default_subtitle_track.mkvmerge_id if result.default_subtitle_track else None,
+        )
+        print(f"✓ Selection recorded for {filename.name}")
+        return selection
+
+    if result.status == TrackSelectionResult.FAILED:
+        analysis_failed.append(filename)
+        print(f"✗ Failed to analyze {filename.name}")
+    else:
+        # File was skipped for valid reasons
+        print(f"⚠ Skipping {filename.name} ({result.status.value})")
+    return None
+
+
+class _PerThreadStdout:
+    """
+    Stand-in for sys.stdout that can collect one thread's output in a buffer.
+
+    Threads without an open buffer write straight through to the wrapped stream.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+        self._local = threading.local()
+
+    @contextmanager
+    def captured(self) -> Iterator[io.StringIO]:
+        """Collect everything the calling thread prints in the yielded buffer."""
+        self._local.buffer = io.StringIO()
+        try:
+            yield self._local.buffer
+        finally:
+            del self._local.buffer
+
+    def _target(self) -> TextIO:
+        buffer: io.StringIO | None = getattr(self._local, "buffer", None)
+        return self._stream if buffer is None else buffer
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+def _analyze_into_queue(
+    files: list[Path],
+    file_stats: dict[Path, os.stat_result],
+    config: LangFilterConfig,
+    results: queue.Queue[AnalysisItem],
+    stdout: _PerThreadStdout,
+    stop: threading.Event,
+    read_ahead_window: int,
+    config_has_rules: bool,
+) -> None:
+    """Analyzer thread of the non-interactive pipeline.
+
+    Pushes each file's analysis result onto ``results`` and a final None sentinel.
+    Stops before the next file once ``stop`` is set.
+    """
+    try:
+        with _read_tracks_ahead(files, file_stats, read_ahead_window) as reads:
+            for i, (filename, read) in enumerate(zip(files, reads, strict=True)):
+                if stop.is_set():
+                    break
+                # Analyze into a buffer and print it as one block, so remux workers
+                # are only held up while the output is written
+                with stdout.captured() as buffer:
+                    result = analyze_and_select_tracks(
+                        filename,
+                        config,
+                        non_interactive=True,
+                        file_stat=file_stats.get(filename),
+                        read_ahead=read,
+                        config_has_rules=config_has_rules,
+                    )
+                with output_lock:
+                    sys.stdout.write(
+                        f"\n--- File {i + 1}/{len(files)}: {filename.name} ---\n"
+                        + buffer.getvalue()
+                    )
+                    sys.stdout.flush()
+                results.put((filename, result))
+    finally:
+        results.put(None)
+
+
+def _stop_analyzer(
+    analyzer: threading.Thread, results: queue.Queue[AnalysisItem], stop: threading.Event
+) -> None:
+    """Stop the analyzer thread and wait for it, draining results it may block on."""
+    stop.set()
+    while analyzer.is_alive():
+        try:
+            results.get(timeout=0.1)
+        except queue.Empty:
+            pass
+    analyzer.join()
+
+
+def _collect_results(futures: dict[Future[bool], Path]) -> tuple[int, list[Path]]:
+    """Wait for Phase 2 workers and return (success count, failed files)."""
+    success_count = 0
+    processing_failed = []
+    # Collect in submission order so the failure list follows the input order
+    for future, filename in futures.items():
+        if future.result():
+            success_count += 1
+        else:
+            processing_failed.append(filename)
+    return success_count, processing_failed
+
+
+def _shows_progress(jobs: int) -> bool:
+    """Live mkvmerge progress only reads well from a single job on a terminal."""
+    return jobs == 1 and sys.stdout.isatty()
+
+
+def _process_all(
+    file_selections: list[FileSelection],
+    jobs: int,
+    output_path: Path | None,
+    create_backup: bool,
+    nice_level: int,
+) -> tuple[int, list[Path]]:
+    """Run Phase 2 over all selections and return (success count, failed files)."""
+    # A lone file runs as a single job whatever --jobs allows
+    show_progress = _shows_progress(min(jobs, len(file_selections)))
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(
+                _process_selected_file,
+                selection,
+                f"{i + 1}/{len(file_selections)}",
+                output_path,
+                create_backup,
+                nice_level,
+                show_progress,
+            ): selection[0]
+            for i, selection in enumerate(file_selections)
+        }
+        try:
+            return _collect_results(futures)
+        except KeyboardInterrupt:
+            # Leaving the block still waits for running files, but queued ones
+            # must not start after Ctrl+C
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
+def _reap_finished(
+    futures: dict[Future[bool], Path], processing_failed: list[Path], wait_for_all: bool
+) -> int:
+    """
+    Wait for Phase 2 workers and drop finished ones from futures.
+
+    Waits for the first completion unless wait_for_all is set. Failed files are
+    appended to processing_failed; returns how many finished successfully.
+    """
+    done, _ = wait(futures, return_when=ALL_COMPLETED if wait_for_all else FIRST_COMPLETED)
+    success_count = 0
+    for future in done:
+        filename = futures.pop(future)
+        if future.result():
+            success_count += 1
+        else:
+            processing_failed.append(filename)
+    return success_count
+
+
+def _write_plan(
+    plan_path: Path,
+    file_selections: list[FileSelection],
+    file_stats: dict[Path, os.stat_result],
+) -> None:
+    """
+    Save Phase 1 selections as JSON for a later `--apply` run.
+
+    The plan is written to a temporary file and moved into place, so an interrupted
+    run never leaves a truncated plan behind.
+    """
+    files = [
+        {
+            "path": str(filename.resolve()),
+            "stamp": file_stamp(file_stats[filename]),
+            "audio_tracks": [track_to_dict(track) for track in audio_tracks],
+            "subtitle_tracks": (
+                [track_to_dict(track) for track in subtitle_tracks]
+                if subtitle_tracks is not None
+                else None
+            ),
+            "default_audio_track_id": default_audio_id,
+            "default_subtitle_track_id": default_subtitle_id,
+        }
+        for (
+            filename,
+            audio_tracks,
+            subtitle_tracks,
+            default_audio_id,
+            default_subtitle_id,
+        ) in file_selections
+    ]
+    tmp_file = plan_path.with_name(f"{plan_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_file.write_text(json.dumps({"version": 1, "files": files}, indent=2) + "\n")
+        os.replace(tmp_file, plan_path)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def _read_plan(plan_path: Path) -> tuple[list[FileSelection], list[Path]]:
+    """
+    Load selections saved by `--dry-run`.
+
+    Returns (selections, changed files). Files that are missing or whose size or
+    modification time differ from the plan are left out of the selections, since
+    their track IDs may no longer be valid.
+    """
+    plan = json.loads(plan_path.read_text())
+    if plan.get("version") != 1:
+        raise ValueError(f"unsupported plan version {plan.get('version')!r}")
+
+    selections: list[FileSelection] = []
+    changed: list[Path] = []
+    for entry in plan["files"]:
+        filename = Path(entry["path"])
+        try:
+            current_stamp = file_stamp(filename.stat())
+        except OSError:
+            current_stamp = None
+        if current_stamp != entry["stamp"]:
+            changed.append(filename)
+            continue
+
+        subtitle_tracks = entry["subtitle_tracks"]
+        selections.append(
+            (
+                filename,
+                [AudioTrack(**track) for track in entry["audio_tracks"]],
+                (
+                    [SubtitleTrack(**track) for track in subtitle_tracks]
+                    if subtitle_tracks is not None
+                    else None
+                ),
+                entry["default_audio_track_id"],
+                entry["default_subtitle_track_id"],
+            )
+        )
+    return selections, changed
+
+
+def _print_summary(
+    analyzed_count: int,
+    success_count: int,
+    selected_count: int,
+    failures: dict[str, list[Path]],
+) -> int:
+    """
+    Print the final summary and return the exit code.
+
+    failures maps a label such as "Processing failed" to the files it applies to.
+    """
+    print(f"\n{'=' * 60}")
+    print("PROCESSING COMPLETE")
+    print(f"{'=' * 60}")
+    print(f"Files analyzed: {analyzed_count}")
+    print(f"Files processed: {success_count}/{selected_count}")
+
+    for label, filenames in failures.items():
+        if filenames:
+            print(f"{label}: {len(filenames)} file(s)")
+            for filename in filenames:
+                print(f"  ✗ {filename.name}")
+
+    if success_count == selected_count and not any(failures.values()):
+        print("✔ All files processed successfully!")
+        return 0
+    elif success_count > 0:
+        print("⚠ Some files failed to process")
+        return 1
+    else:
+        print("✗ No files were processed successfully")
+        return 1
+
+
+def _apply_plan(plan_path: Path, args: argparse.Namespace) -> int:
+    """Run Phase 2 on the selections saved by an earlier `--dry-run`."""
+    try:
+        file_selections, changed = _read_plan(plan_path)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Error: Cannot read plan '{plan_path}': {e}", file=sys.stderr)
+        return 1
+
+    for filename in changed:
+        print(
+            f"Warning: '{filename}' is missing or changed since the plan was made; skipping.",
+            file=sys.stderr,
+        )
+    if not file_selections:
+        return _report_nothing_to_process(changed)
+
+    print(f"\n{'=' * 60}")
+    print(f"PHASE 2: Processing {len(file_selections)} file(s) from plan {plan_path}")
+    print(f"{'=' * 60}")
+
+    try:
+        success_count, processing_failed = _process_all(
+            file_selections,
+            args.jobs,
+            None,
+            not args.no_backup,
+            args.nice,
+        )
+    except KeyboardInterrupt:
+        print("\nOperation cancelled by user.")
+        return 1
+
+    return _print_summary(
+        len(file_selections) + len(changed),
+        success_count,
+        len(file_selections),
+        {"Changed since plan": changed, "Processing failed": processing_failed},
+    )
+
+
+def _report_nothing_to_process(analysis_failed: list[Path]) -> int:
+    """Print the no-selection message and return the exit code."""
+    print(f"\n{'=' * 60}")
+    print("No files to process (no valid selections made)")
+    return 0 if not analysis_failed else 1
+
+
+def _positive_int(value: str) -> int:
+    """Argparse type for options that take a count of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main() -> int:
     """Main entry point for langfilter."""
     parser = argparse.ArgumentParser(
@@ -305,9 +814,9 @@ def main() -> int:
 
     parser.add_argument(
         "filenames",
-        nargs="+",
+        nargs="*",
         type=Path,
-        help="Path(s) to the MKV file(s) to process",
+        help="Path(s) to the MKV file(s) to process (not used with --apply)",
     )
 
     parser.add_argument(
@@ -337,6 +846,37 @@ def main() -> int:
         help="Path to configuration file (default: auto-detect)",
     )
 
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=_positive_int,
+        default=_DEFAULT_JOBS,
+        help="Number of files to process in parallel (default: half the CPU cores, %(default)s)",
+    )
+
+    parser.add_argument(
+        "--nice",
+        type=int,
+        choices=range(20),
+        default=0,
+        metavar="N",
+        help="Lower mkvmerge's CPU priority by N (0-19) to keep the system responsive",
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        type=Path,
+        metavar="PLAN",
+        help="Only analyze the files and save the track selections to PLAN for --apply",
+    )
+
+    parser.add_argument(
+        "--apply",
+        type=Path,
+        metavar="PLAN",
+        help="Process the files in PLAN (written by --dry-run) without analyzing them again",
+    )
+
     parser.add_argument(
         "--version",
         action="version",
@@ -346,18 +886,39 @@ def main() -> int:
     args = parser.parse_args()
 
     # Validate arguments
+    if args.apply is not None:
+        if args.filenames:
+            parser.error("--apply takes the files from the plan; do not pass filenames")
+        if args.dry_run is not None:
+            parser.error("--apply cannot be combined with --dry-run")
+    elif not args.filenames:
+        parser.error("the following arguments are required: filenames")
+
+    if args.output and (args.apply is not None or args.dry_run is not None):
+        parser.error("--output cannot be used with --dry-run or --apply")
+
     if args.output and len(args.filenames) > 1:
         print("Error: --output can only be used with a single input file.", file=sys.stderr)
         return 1
 
+    if args.apply is not None:
+        return _apply_plan(args.apply, args)
+
     # Validate that all files exist
+    # One stat per file; the result is reused for the track cache lookup
     valid_files = []
+    file_stats: dict[Path, os.stat_result] = {}
     for filename in args.filenames:
-        if not filename.exists():
+        try:
+            file_stat = filename.stat()
+        except FileNotFoundError:
             print(f"Error: File '{filename}' does not exist.", file=sys.stderr)
             continue
+        except OSError as e:
+            print(f"Error: Cannot access '{filename}': {e.strerror}", file=sys.stderr)
+            continue
 
-        if not filename.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             print(f"Error: '{filename}' is not a file.", file=sys.stderr)
             continue
 
@@ -366,6 +927,7 @@ def main() -> int:
             print(f"Warning: '{filename}' does not have .mkv extension.", file=sys.stderr)
 
         valid_files.append(filename)
+        file_stats[filename] = file_stat
 
     if not valid_files:
         print("Error: No valid files to process.", file=sys.stderr)
@@ -403,9 +965,12 @@ def main() -> int:
             except Exception as e:
                 print(f"Warning: Failed to load config from {config_path}: {e}", file=sys.stderr)
 
+        # The config doesn't change during the run, so check for rules once
+        config_has_rules = config is not None and config.has_rules()
+
         # Validate non-interactive mode requirements
         if args.non_interactive:
-            if config is None or not config.has_rules():
+            if not config_has_rules:
                 print(
                     "Error: Non-interactive mode requires a configuration file with rules.",
                     file=sys.stderr,
@@ -417,111 +982,131 @@ def main() -> int:
                 return 1
             print(f"Running in non-interactive mode with rules: {config}")
 
-        # Phase 1: Analyze all files and collect selections
-        file_selections = []
-        analysis_failed = []
-
-        print(f"\n{'=' * 60}")
-        print(f"PHASE 1: Analyzing {len(valid_files)} file(s) and collecting track selections")
-        print(f"{'=' * 60}")
-
-        for i, filename in enumerate(valid_files):
-            print(f"\n--- File {i + 1}/{len(valid_files)}: {filename.name} ---")
-
-            try:
-                result = analyze_and_select_tracks(filename, config, args.non_interactive)
-            except UserCancelledError:
-                print("Operation cancelled by user.")
-                return 1
+        jobs = args.jobs
+        analysis_failed: list[Path] = []
+        processing_failed: list[Path] = []
+        success_count = 0
+        output_path = args.output if len(valid_files) == 1 else None
+        create_backup = not args.no_backup
 
-            if result.should_process:
-                file_selections.append(
-                    (
-                        filename,
-                        result.selected_tracks or [],
-                        result.selected_subtitle_tracks,
-                        result.default_audio_track,
-                        result.default_subtitle_track,
-                    )
+        if args.non_interactive and args.dry_run is None and len(valid_files) > 1:
+            # Without prompts, analysis can run ahead on its own thread so remuxing
+            # starts as soon as the first selection is ready. Selections are handed
+            # straight to the workers; only failed filenames are kept for the summary.
+            print(f"\n{'=' * 60}")
+            print(f"Analyzing and processing {len(valid_files)} file(s)")
+            print(f"{'=' * 60}")
+
+            results: queue.Queue[AnalysisItem] = queue.Queue(maxsize=jobs * 2)
+            stop = threading.Event()
+            with redirect_stdout(_PerThreadStdout(sys.stdout)) as stdout:
+                analyzer = threading.Thread(
+                    target=_analyze_into_queue,
+                    args=(
+                        valid_files,
+                        file_stats,
+                        config,
+                        results,
+                        stdout,
+                        stop,
+                        jobs * _READ_AHEAD_PER_JOB,
+                        config_has_rules,
+                    ),
+                    daemon=True,
                 )
-                print(f"✓ Selection recorded for {filename.name}")
-            elif result.status == TrackSelectionResult.FAILED:
-                analysis_failed.append(filename)
-                print(f"✗ Failed to analyze {filename.name}")
-            else:
-                # File was skipped for valid reasons
-                print(f"⚠ Skipping {filename.name} ({result.status.value})")
-
-        if not file_selections:
+                analyzer.start()
+                try:
+                    selected_count = 0
+                    with ThreadPoolExecutor(max_workers=jobs) as executor:
+                        pending: dict[Future[bool], Path] = {}
+                        analyzed = 0
+                        while (item := results.get()) is not None:
+                            filename, result = item
+                            analyzed += 1
+                            with output_lock:
+                                selection = _record_analysis(filename, result, analysis_failed)
+                            if selection is None:
+                                continue
+
+                            selected_count += 1
+                            # Submit no more files than there are workers so selections
+                            # never pile up
+                            if len(pending) >= jobs:
+                                success_count += _reap_finished(pending, processing_failed, False)
+                            future = executor.submit(
+                                _process_selected_file,
+                                selection,
+                                f"{analyzed}/{len(valid_files)}",
+                                output_path,
+                                create_backup,
+                                args.nice,
+                                # The analyzer prints alongside, so no in-place progress line
+                                False,
+                            )
+                            pending[future] = filename
+                        if pending:
+                            success_count += _reap_finished(pending, processing_failed, True)
+                finally:
+                    # Its track reads still update the track cache, which is saved on exit
+                    _stop_analyzer(analyzer, results, stop)
+
+            if not selected_count:
+                return _report_nothing_to_process(analysis_failed)
+        else:
+            # Phase 1: Analyze all files and collect selections
             print(f"\n{'=' * 60}")
-            print("No files to process (no valid selections made)")
-            return 0 if not analysis_failed else 1
+            print(f"PHASE 1: Analyzing {len(valid_files)} file(s) and collecting track selections")
+            print(f"{'=' * 60}")
+
+            # Reading ahead is safe without prompts; interactive files are read one by one
+            file_selections: list[FileSelection] = []
+            ahead_files = valid_files if args.non_interactive else []
+            with _read_tracks_ahead(ahead_files, file_stats, jobs * _READ_AHEAD_PER_JOB) as reads:
+                for i, filename in enumerate(valid_files):
+                    print(f"\n--- File {i + 1}/{len(valid_files)}: {filename.name} ---")
+
+                    try:
+                        result = analyze_and_select_tracks(
+                            filename,
+                            config,
+                            args.non_interactive,
+                            file_stats.get(filename),
+                            next(reads, None),
+                            config_has_rules,
+                        )
+                    except UserCancelledError:
+                        print("Operation cancelled by user.")
+                        return 1
 
-        # Phase 2: Process all files with their selections
-        print(f"\n{'=' * 60}")
-        print(f"PHASE 2: Processing {len(file_selections)} file(s) with selected tracks")
-        print(f"{'=' * 60}")
+                    selection = _record_analysis(filename, result, analysis_failed)
+                    if selection is not None:
+                        file_selections.append(selection)
 
-        success_count = 0
-        processing_failed = []
+            if not file_selections:
+                return _report_nothing_to_process(analysis_failed)
 
-        for i, (
-            filename,
-            selected_tracks,
-            selected_subtitle_tracks,
-            default_audio_track,
-            default_subtitle_track,
-        ) in enumerate(file_selections):
-            print(f"\n--- Processing {i + 1}/{len(file_selections)}: {filename.name} ---")
-            track_summary_parts = []
-            if selected_tracks:
-                track_summary_parts.append(f"{len(selected_tracks)} audio track(s)")
-            if selected_subtitle_tracks:
-                track_summary_parts.append(f"{len(selected_subtitle_tracks)} subtitle track(s)")
-            print(f"Keeping {', '.join(track_summary_parts)}...")
-
-            success = process_file_with_selection(
-                filename,
-                selected_tracks,
-                args.output if len(valid_files) == 1 else None,
-                True,  # Always replace original file (new default behavior)
-                not args.no_backup,
-                selected_subtitle_tracks,
-                default_audio_track,
-                default_subtitle_track,
-            )
+            if args.dry_run is not None:
+                _write_plan(args.dry_run, file_selections, file_stats)
+                print(f"\nSaved selections for {len(file_selections)} file(s) to {args.dry_run}")
+                print(f"Run 'langfilter --apply {args.dry_run}' to process them.")
+                return 0 if not analysis_failed else 1
 
-            if success:
-                success_count += 1
-            else:
-                processing_failed.append(filename)
-
-        # Final summary
-        print(f"\n{'=' * 60}")
-        print("PROCESSING COMPLETE")
-        print(f"{'=' * 60}")
-        print(f"Files analyzed: {len(valid_files)}")
-        print(f"Files processed: {success_count}/{len(file_selections)}")
-
-        if analysis_failed:
-            print(f"Analysis failed: {len(analysis_failed)} file(s)")
-            for filename in analysis_failed:
-                print(f"  ✗ {filename.name}")
+            # Phase 2: Process all files with their selections
+            print(f"\n{'=' * 60}")
+            print(f"PHASE 2: Processing {len(file_selections)} file(s) with selected tracks")
+            print(f"{'=' * 60}")
 
-        if processing_failed:
-            print(f"Processing failed: {len(processing_failed)} file(s)")
-            for filename in processing_failed:
-                print(f"  ✗ {filename.name}")
+            success_count, processing_failed = _process_all(
+                file_selections, jobs, output_path, create_backup, args.nice
+            )
+            selected_count = len(file_selections)
 
-        if success_count == len(file_selections) and not analysis_failed:
-            print("✔ All files processed successfully!")
-            return 0
-        elif success_count > 0:
-            print("⚠ Some files failed to process")
-            return 1
-        else:
-            print("✗ No files were processed successfully")
-            return 1
+        return _print_summary(
+            len(valid_files),
+            success_count,
+            selected_count,
+            {"Analysis failed": analysis_failed, "Processing failed": processing_failed},
+        )
 
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
@@ -531,6 +1116,9 @@ def main() -> int:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
+    finally:
+        save_track_cache()
+
 
 if __name__ == "__main__":
     sys.exit(main())
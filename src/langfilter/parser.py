@@ -1,14 +1,36 @@
-"""Parser for mkvinfo output to extract track information."""
+"""Track information from MKV files, read directly or via mkvmerge output."""
 
 from __future__ import annotations
 
-import re
 import subprocess
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field, fields
 from pathlib import Path
+from typing import Any, TypeVar
 
+from langfilter.ebml import (
+    TRACK_TYPE_AUDIO,
+    TRACK_TYPE_SUBTITLE,
+    EbmlError,
+    TrackEntry,
+    read_track_entries,
+)
 
-@dataclass
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional (the "fast" extra); stdlib json also takes bytes
+    from json import loads as _json_loads
+
+# Interned so set membership checks against config languages hit the identity fast path
+_UNKNOWN_LANGUAGE = sys.intern("unknown")
+
+
+def _normalize_language(language: str | None) -> str:
+    """Lowercase and intern a track language, mapping a missing one to "unknown"."""
+    return sys.intern(language.lower()) if language else _UNKNOWN_LANGUAGE
+
+
+@dataclass(frozen=True, slots=True)
 class AudioTrack:
     """Represents an audio track in an MKV file."""
 
@@ -18,6 +40,11 @@ class AudioTrack:
     name: str | None
     codec: str | None
     channels: int | None
+    # Lowercased, interned language code ("unknown" if not set), computed once
+    norm_language: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "norm_language", _normalize_language(self.language))
 
     def __str__(self) -> str:
         """String representation for display."""
@@ -27,7 +54,7 @@ class AudioTrack:
         return f"Track {self.track_number} {lang_str}{name_str}{channels_str}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SubtitleTrack:
     """Represents a subtitle track in an MKV file."""
 
@@ -36,6 +63,11 @@ class SubtitleTrack:
     language: str | None
     name: str | None
     codec: str | None
+    # Lowercased, interned language code ("unknown" if not set), computed once
+    norm_language: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "norm_language", _normalize_language(self.language))
 
     def __str__(self) -> str:
         """String representation for display."""
@@ -44,141 +76,126 @@ class SubtitleTrack:
         return f"Track {self.track_number} {lang_str}{name_str}"
 
 
-def parse_mkvinfo_output(output: str) -> list[AudioTrack]:
-    """Parse mkvinfo output and extract audio track information."""
-    tracks = []
-    current_track = None
-    in_audio_track = False
-
-    for line in output.split("\n"):
-        line = line.strip()
-
-        # Start of a new track
-        if match := re.match(
-            r".*\+ Track number: (\d+) \(track ID for mkvmerge & mkvextract: (\d+)\)", line
-        ):
-            if current_track and in_audio_track:
-                tracks.append(current_track)
-
-            track_number = int(match.group(1))
-            mkvmerge_id = int(match.group(2))
-            current_track = AudioTrack(
-                track_number=track_number,
-                mkvmerge_id=mkvmerge_id,
-                language=None,
-                name=None,
-                codec=None,
-                channels=None,
+# Either track type, for helpers that work on both audio and subtitle lists
+TrackT = TypeVar("TrackT", AudioTrack, SubtitleTrack)
+
+
+def track_to_dict(track: AudioTrack | SubtitleTrack) -> dict[str, Any]:
+    """Return the constructor fields of a track, for JSON storage; derived fields are left out."""
+    return {f.name: getattr(track, f.name) for f in fields(track) if f.init}
+
+
+def parse_mkvmerge_json(output: str | bytes) -> tuple[list[AudioTrack], list[SubtitleTrack]]:
+    """
+    Parse `mkvmerge -J` output into audio and subtitle tracks.
+
+    Uses orjson when installed. Passing the raw bytes avoids a decode step.
+    """
+    info = _json_loads(output)
+    if not info.get("container", {}).get("recognized", True):
+        errors = "; ".join(info.get("errors", [])) or "unrecognized file format"
+        raise RuntimeError(f"mkvmerge could not identify the file: {errors}")
+
+    audio_tracks = []
+    subtitle_tracks = []
+    for track in info.get("tracks", []):
+        track_type = track.get("type")
+        if track_type not in ("audio", "subtitles"):
+            continue
+
+        properties = track.get("properties", {})
+        track_number = properties.get("number", track["id"] + 1)
+        language = properties.get("language")
+        name = properties.get("track_name")
+        codec = properties.get("codec_id")
+
+        if track_type == "audio":
+            audio_tracks.append(
+                AudioTrack(
+                    track_number=track_number,
+                    mkvmerge_id=track["id"],
+                    language=language,
+                    name=name,
+                    codec=codec,
+                    channels=properties.get("audio_channels"),
+                )
             )
-            in_audio_track = False
-
-        # Track type
-        elif re.search(r"\+ Track type: audio", line) and current_track:
-            in_audio_track = True
-
-        elif re.search(r"\+ Track type:", line) and not re.search(r"\+ Track type: audio", line):
-            in_audio_track = False
-
-        # Track properties (only if we're in an audio track)
-        elif in_audio_track and current_track:
-            if match := re.search(r"\+ Language: (.+)", line):
-                current_track.language = match.group(1)
-
-            elif match := re.search(r"\+ Name: (.+)", line):
-                current_track.name = match.group(1)
-
-            elif match := re.search(r"\+ Codec ID: (.+)", line):
-                current_track.codec = match.group(1)
-
-            elif match := re.search(r"\+ Channels: (\d+)", line):
-                current_track.channels = int(match.group(1))
-
-    # Don't forget the last track
-    if current_track and in_audio_track:
-        tracks.append(current_track)
-
-    return tracks
-
-
-def parse_subtitle_tracks(output: str) -> list[SubtitleTrack]:
-    """Parse mkvinfo output and extract subtitle track information."""
-    tracks = []
-    current_track = None
-    in_subtitle_track = False
-
-    for line in output.split("\n"):
-        line = line.strip()
-
-        # Start of a new track
-        if match := re.match(
-            r".*\+ Track number: (\d+) \(track ID for mkvmerge & mkvextract: (\d+)\)", line
-        ):
-            if current_track and in_subtitle_track:
-                tracks.append(current_track)
-
-            track_number = int(match.group(1))
-            mkvmerge_id = int(match.group(2))
-            current_track = SubtitleTrack(
-                track_number=track_number,
-                mkvmerge_id=mkvmerge_id,
-                language=None,
-                name=None,
-                codec=None,
+        else:
+            subtitle_tracks.append(
+                SubtitleTrack(
+                    track_number=track_number,
+                    mkvmerge_id=track["id"],
+                    language=language,
+                    name=name,
+                    codec=codec,
+                )
             )
-            in_subtitle_track = False
-
-        # Track type
-        elif re.search(r"\+ Track type: subtitles", line) and current_track:
-            in_subtitle_track = True
-
-        elif re.search(r"\+ Track type:", line) and not re.search(
-            r"\+ Track type: subtitles", line
-        ):
-            in_subtitle_track = False
-
-        # Track properties (only if we're in a subtitle track)
-        elif in_subtitle_track and current_track:
-            if match := re.search(r"\+ Language: (.+)", line):
-                current_track.language = match.group(1)
-
-            elif match := re.search(r"\+ Name: (.+)", line):
-                current_track.name = match.group(1)
 
-            elif match := re.search(r"\+ Codec ID: (.+)", line):
-                current_track.codec = match.group(1)
-
-    # Don't forget the last track
-    if current_track and in_subtitle_track:
-        tracks.append(current_track)
+    return audio_tracks, subtitle_tracks
+
+
+def tracks_from_entries(
+    entries: list[TrackEntry],
+) -> tuple[list[AudioTrack], list[SubtitleTrack]]:
+    """Convert Matroska track entries, in file order, into audio and subtitle tracks."""
+    audio_tracks = []
+    subtitle_tracks = []
+    for entry in entries:
+        # read_track_entries only returns lists numbered 1, 2, 3... in file order,
+        # where mkvmerge's zero-based track IDs are the track numbers minus one
+        mkvmerge_id = entry.number - 1
+        if entry.track_type == TRACK_TYPE_AUDIO:
+            audio_tracks.append(
+                AudioTrack(
+                    track_number=entry.number,
+                    mkvmerge_id=mkvmerge_id,
+                    language=entry.language,
+                    name=entry.name,
+                    codec=entry.codec_id,
+                    channels=entry.channels,
+                )
+            )
+        elif entry.track_type == TRACK_TYPE_SUBTITLE:
+            subtitle_tracks.append(
+                SubtitleTrack(
+                    track_number=entry.number,
+                    mkvmerge_id=mkvmerge_id,
+                    language=entry.language,
+                    name=entry.name,
+                    codec=entry.codec_id,
+                )
+            )
+    return audio_tracks, subtitle_tracks
 
-    return tracks
 
+def get_all_tracks(mkv_file: Path) -> tuple[list[AudioTrack], list[SubtitleTrack]]:
+    """
+    Get audio and subtitle tracks from an MKV file.
 
-def get_audio_tracks(mkv_file: Path) -> list[AudioTrack]:
-    """Get all audio tracks from an MKV file using mkvinfo."""
+    Reads the Matroska track list directly, which needs no external process. Falls
+    back to a single `mkvmerge -J` call for files the built-in reader can't handle.
+    """
     try:
-        result = subprocess.run(
-            ["mkvinfo", str(mkv_file)], capture_output=True, text=True, check=True
-        )
-        return parse_mkvinfo_output(result.stdout)
+        return tracks_from_entries(read_track_entries(mkv_file))
+    except (EbmlError, OSError):
+        return _get_all_tracks_with_mkvmerge(mkv_file)
 
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"mkvinfo failed: {e.stderr}") from e
 
+def _get_all_tracks_with_mkvmerge(
+    mkv_file: Path,
+) -> tuple[list[AudioTrack], list[SubtitleTrack]]:
+    """Get audio and subtitle tracks from an MKV file with a single `mkvmerge -J` call."""
+    try:
+        result = subprocess.run(["mkvmerge", "-J", str(mkv_file)], capture_output=True, check=False)
     except FileNotFoundError as e:
-        raise RuntimeError("mkvinfo command not found. Please install mkvtoolnix.") from e
+        raise RuntimeError("mkvmerge command not found. Please install mkvtoolnix.") from e
 
+    # Exit code 1 only signals warnings, the JSON is still complete
+    if result.returncode > 1:
+        output = result.stderr or result.stdout
+        raise RuntimeError(f"mkvmerge failed: {output.decode(errors='replace')}")
 
-def get_subtitle_tracks(mkv_file: Path) -> list[SubtitleTrack]:
-    """Get all subtitle tracks from an MKV file using mkvinfo."""
     try:
-        result = subprocess.run(
-            ["mkvinfo", str(mkv_file)], capture_output=True, text=True, check=True
-        )
-        return parse_subtitle_tracks(result.stdout)
-
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"mkvinfo failed: {e.stderr}") from e
-
-    except FileNotFoundError as e:
-        raise RuntimeError("mkvinfo command not found. Please install mkvtoolnix.") from e
+        return parse_mkvmerge_json(result.stdout)
+    except (ValueError, KeyError, TypeError) as e:
+        raise RuntimeError(f"Could not parse mkvmerge output: {e}") from e
@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import os
+import re
+import shlex
 import subprocess
+import sys
+import threading
+from collections.abc import Callable
 from pathlib import Path
 
 from langfilter.parser import AudioTrack, SubtitleTrack
 
+# Held around status output so lines from parallel jobs are never torn apart
+output_lock = threading.Lock()
+
+# mkvmerge redraws "Progress: N%" with carriage returns, which text mode reads as lines
+_PROGRESS_RE = re.compile(r"Progress: (\d+)%")
+
 
 def remove_unwanted_tracks(
     input_file: Path,
@@ -15,11 +27,14 @@ def remove_unwanted_tracks(
     subtitle_tracks_to_keep: list[SubtitleTrack] | None = None,
     default_audio_track_id: int | None = None,
     default_subtitle_track_id: int | None = None,
+    nice_level: int = 0,
+    show_progress: bool = False,
 ) -> Path:
     """
     Remove unwanted audio and subtitle tracks from MKV file using mkvmerge.
 
-    Also sets default tracks if specified.
+    Also sets default tracks if specified. A positive nice_level runs mkvmerge at
+    lower CPU priority. show_progress redraws mkvmerge's progress on one line.
     """
     if output_file is None:
         # Create output filename with suffix
@@ -35,16 +50,15 @@ def remove_unwanted_tracks(
 
     # Add audio track selection
     # We need to keep track 0 (video) and selected audio tracks
-    audio_track_ids = [str(track.mkvmerge_id) for track in tracks_to_keep]
-
     # Include video track (track 0) and selected audio tracks
-    tracks_arg = "0," + ",".join(audio_track_ids)
+    tracks_arg = ",".join(["0", *(str(track.mkvmerge_id) for track in tracks_to_keep)])
     cmd.extend(["--audio-tracks", tracks_arg])
 
     # Add subtitle track selection if provided
     if subtitle_tracks_to_keep:
-        subtitle_track_ids = [str(track.mkvmerge_id) for track in subtitle_tracks_to_keep]
-        subtitle_tracks_arg = "0," + ",".join(subtitle_track_ids)
+        subtitle_tracks_arg = ",".join(
+            ["0", *(str(track.mkvmerge_id) for track in subtitle_tracks_to_keep)]
+        )
         cmd.extend(["--subtitle-tracks", subtitle_tracks_arg])
 
     # Set default audio track
@@ -58,14 +72,19 @@ def remove_unwanted_tracks(
     # Input file
     cmd.append(str(input_file))
 
-    print(f"Running: {' '.join(cmd)}")
-    print("This may take a while...")
+    with output_lock:
+        print(f"Running: {_format_command(cmd)}\nThis may take a while...")
 
     try:
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
-
-        print("✔ Successfully created filtered MKV file")
-        print(f"Output: {output_file}")
+        try:
+            _run_with_priority(cmd, nice_level, _print_progress if show_progress else None)
+        finally:
+            if show_progress:
+                # End the progress line
+                print()
+
+        with output_lock:
+            print(f"✔ Successfully created filtered MKV file\nOutput: {output_file}")
         return output_file
 
     except subprocess.CalledProcessError as e:
@@ -74,14 +93,69 @@ def remove_unwanted_tracks(
             output_file.unlink()
 
         error_msg = f"mkvmerge failed (exit code {e.returncode})"
-        if e.stderr:
-            error_msg += f": {e.stderr}"
+        if e.output:
+            error_msg += f": {e.output}"
         raise RuntimeError(error_msg) from e
 
     except FileNotFoundError as e:
         raise RuntimeError("mkvmerge command not found. Please install mkvtoolnix.") from e
 
 
+def _format_command(cmd: list[str]) -> str:
+    """Quote a command for display so it can be pasted back into the shell."""
+    if sys.platform == "win32":
+        return subprocess.list2cmdline(cmd)
+    return shlex.join(cmd)
+
+
+def _print_progress(percent: int) -> None:
+    """Redraw the mkvmerge progress in place."""
+    print(f"\rProgress: {percent}%", end="", flush=True)
+
+
+def _run_with_priority(
+    cmd: list[str], nice_level: int, on_progress: Callable[[int], None] | None = None
+) -> None:
+    """
+    Run mkvmerge to completion, raising CalledProcessError on failure.
+
+    The child's niceness is raised by nice_level after it starts. This is done from
+    the parent rather than with preexec_fn, which is unsafe with worker threads.
+    Output is read as it arrives: progress lines go to on_progress and are dropped,
+    and only the remaining messages are kept as the error's output. mkvmerge
+    reports errors on stdout, so stderr is merged into it.
+    """
+    creationflags = 0
+    if nice_level > 0 and sys.platform == "win32":
+        creationflags = subprocess.BELOW_NORMAL_PRIORITY_CLASS
+
+    messages = []
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        creationflags=creationflags,
+    ) as process:
+        if nice_level > 0 and sys.platform != "win32":
+            try:
+                current = os.getpriority(os.PRIO_PROCESS, 0)
+                os.setpriority(os.PRIO_PROCESS, process.pid, current + nice_level)
+            except OSError:
+                # The process may already have exited; priority is best effort
+                pass
+        assert process.stdout is not None
+        for line in process.stdout:
+            if match := _PROGRESS_RE.match(line):
+                if on_progress is not None:
+                    on_progress(int(match[1]))
+            elif line.strip():
+                messages.append(line)
+
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd, "".join(messages))
+
+
 def create_backup(input_file: Path) -> Path:
     """Create a backup of the original file."""
     backup_file = input_file.parent / f"_original_{input_file.name}"
@@ -109,8 +183,10 @@ def replace_original(
     """Replace the original file with the filtered version."""
     if create_backup_file:
         backup_file = create_backup(input_file)
-        print(f"✔ Created backup: {backup_file}")
+        with output_lock:
+            print(f"✔ Created backup: {backup_file}")
 
     # Replace original with filtered version
     filtered_file.replace(input_file)
-    print(f"✔ Replaced original file: {input_file}")
+    with output_lock:
+        print(f"✔ Replaced original file: {input_file}")
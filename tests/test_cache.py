@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from langfilter import cache
+from langfilter.cache import get_cached_tracks, save_track_cache, store_tracks
+from langfilter.parser import AudioTrack, SubtitleTrack
+
+AUDIO = [AudioTrack(2, 1, "eng", "Stereo", "A_AAC", 2)]
+SUBTITLES = [SubtitleTrack(3, 2, "fin", None, "S_TEXT/UTF8")]
+
+
+def _use_cache_dir(directory: str) -> None:
+    """Point the track cache at an empty directory and forget what was loaded."""
+    os.environ["XDG_CACHE_HOME"] = directory
+    cache._entries = None
+    cache._dirty = False
+
+
+def _stored_mkv(directory: str) -> Path:
+    """A file whose tracks are in the cache, saved to disk and read back fresh."""
+    mkv = Path(directory) / "movie.mkv"
+    mkv.write_bytes(b"video")
+    store_tracks(mkv, AUDIO, SUBTITLES)
+    save_track_cache()
+    cache._entries = None
+    return mkv
+
+
+def test_saved_tracks_are_found_until_the_file_changes():
+    old_cache_home = os.environ.get("XDG_CACHE_HOME")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            _use_cache_dir(tmp)
+            mkv = _stored_mkv(tmp)
+            assert get_cached_tracks(mkv) == (AUDIO, SUBTITLES)
+            # Stats taken by the caller are used as is
+            assert get_cached_tracks(mkv, mkv.stat()) == (AUDIO, SUBTITLES)
+
+            mkv.write_bytes(b"longer video")
+            assert get_cached_tracks(mkv) is None
+    finally:
+        _restore_cache_home(old_cache_home)
+
+
+def test_mtime_change_alone_invalidates_the_entry():
+    old_cache_home = os.environ.get("XDG_CACHE_HOME")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            _use_cache_dir(tmp)
+            mkv = _stored_mkv(tmp)
+            stat = mkv.stat()
+
+            # Same size, modified one nanosecond later
+            os.utime(mkv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            assert get_cached_tracks(mkv) is None
+    finally:
+        _restore_cache_home(old_cache_home)
+
+
+def test_unusable_cache_contents_are_misses():
+    old_cache_home = os.environ.get("XDG_CACHE_HOME")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            _use_cache_dir(tmp)
+            mkv = _stored_mkv(tmp)
+            cache_file = Path(tmp) / "langfilter" / "tracks.json"
+
+            # Entries written with other track fields
+            entries = json.loads(cache_file.read_text())
+            entries[str(mkv.resolve())]["audio"][0]["bitrate"] = 128
+            cache_file.write_text(json.dumps(entries))
+            assert get_cached_tracks(mkv) is None
+
+            cache._entries = None
+            cache_file.write_text("not json")
+            assert get_cached_tracks(mkv) is None
+    finally:
+        _restore_cache_home(old_cache_home)
+
+
+def _restore_cache_home(old_cache_home: str | None) -> None:
+    if old_cache_home is None:
+        os.environ.pop("XDG_CACHE_HOME", None)
+    else:
+        os.environ["XDG_CACHE_HOME"] = old_cache_home
+    cache._entries = None
+    cache._dirty = False
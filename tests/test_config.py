@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import configparser
+import tempfile
+from pathlib import Path
+from textwrap import dedent
+
+from langfilter.config import LangFilterConfig, _read_ini
+
+
+def _write_ini(directory: str, text: str) -> Path:
+    path = Path(directory) / "langfilter.ini"
+    path.write_text(dedent(text).lstrip())
+    return path
+
+
+def _configparser_sections(path: Path) -> dict[str, dict[str, str]]:
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read(path)
+    return {name: dict(parser[name]) for name in parser.sections()}
+
+
+def test_read_ini_matches_configparser():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_ini(
+            tmp,
+            """
+            # leading comment
+            [DEFAULT]
+            Default_Audio = eng
+
+            [audio]
+            Keep = eng, jpn
+            ; indented continuation lines extend the value
+            remove: rus,
+              ukr
+
+            [subtitles]
+            keep = eng
+            default_audio = fin
+            """,
+        )
+        sections = _read_ini(path)
+
+        assert sections == _configparser_sections(path)
+        assert list(sections) == ["audio", "subtitles"]
+        assert sections["audio"]["default_audio"] == "eng"
+        assert sections["subtitles"]["default_audio"] == "fin"
+        assert sections["audio"]["remove"] == "rus,\nukr"
+
+
+def test_default_section_is_not_the_first_section_fallback():
+    with tempfile.TemporaryDirectory() as tmp:
+        only_default = _write_ini(
+            tmp,
+            """
+            [DEFAULT]
+            remove = rus
+            """,
+        )
+        config = LangFilterConfig.load_from_file(only_default)
+        assert not config.has_rules()
+
+        path = _write_ini(
+            tmp,
+            """
+            [DEFAULT]
+            default_audio = eng
+
+            [main]
+            remove = rus
+            """,
+        )
+        config = LangFilterConfig.load_from_file(path)
+        assert config.remove_languages == {"rus"}
+        assert config.default_audio_language == "eng"
+
+
+def test_duplicate_sections_and_keys_are_rejected():
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = {
+            "section": """
+                [audio]
+                keep = eng
+                [audio]
+                remove = rus
+                """,
+            "key": """
+                [audio]
+                keep = eng
+                KEEP = jpn
+                """,
+        }
+        for kind, text in cases.items():
+            path = _write_ini(tmp, text)
+            try:
+                _read_ini(path)
+            except ValueError as e:
+                assert f"duplicate {kind}" in str(e)
+            else:
+                raise AssertionError(f"duplicate {kind} was accepted")
+
+            try:
+                configparser.ConfigParser().read(path)
+            except configparser.Error:
+                pass
+            else:
+                raise AssertionError(f"configparser accepted a duplicate {kind}")
+
+
+def test_missing_config_loads_empty():
+    with tempfile.TemporaryDirectory() as tmp:
+        config = LangFilterConfig.load_from_file(Path(tmp) / "missing.ini")
+        assert not config.has_rules()
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+from langfilter.ebml import EbmlError, read_track_entries
+from langfilter.parser import get_all_tracks, tracks_from_entries
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+VIDEO, AUDIO, SUBTITLE = 1, 2, 0x11
+
+
+def _element(element_id: int, payload: bytes) -> bytes:
+    """Encode one EBML element, with the smallest size field that fits."""
+    length = 1
+    while len(payload) >= (1 << (7 * length)) - 1:
+        length += 1
+    size = ((1 << (7 * length)) | len(payload)).to_bytes(length, "big")
+    return element_id.to_bytes((element_id.bit_length() + 7) // 8, "big") + size + payload
+
+
+def _uint(element_id: int, value: int) -> bytes:
+    return _element(element_id, value.to_bytes(max(1, (value.bit_length() + 7) // 8), "big"))
+
+
+def _string(element_id: int, value: str) -> bytes:
+    return _element(element_id, value.encode())
+
+
+def _track(
+    number: int,
+    track_type: int,
+    language: str | None = None,
+    *,
+    bcp47: str | None = None,
+    name: str | None = None,
+    codec: str = "A_OPUS",
+    channels: int | None = None,
+) -> bytes:
+    payload = _uint(0xD7, number) + _uint(0x73C5, number * 1000) + _uint(0x83, track_type)
+    if language is not None:
+        payload += _string(0x22B59C, language)
+    if bcp47 is not None:
+        payload += _string(0x22B59D, bcp47)
+    if name is not None:
+        payload += _string(0x536E, name)
+    payload += _string(0x86, codec)
+    if channels is not None:
+        payload += _element(0xE1, _uint(0x9F, channels))
+    return _element(0xAE, payload)
+
+
+def _mkv(*tracks: bytes, before_tracks: bytes = b"") -> bytes:
+    """A minimal Matroska file: EBML header, then a Segment holding the given tracks."""
+    header = _element(0x1A45DFA3, _string(0x4282, "matroska"))
+    info = _element(0x1549A966, _uint(0x2AD7B1, 1_000_000))
+    cluster = _element(0x1F43B675, _uint(0xE7, 0))
+    tracks_element = _element(0x1654AE6B, b"".join(tracks))
+    return header + _element(0x18538067, info + before_tracks + tracks_element + cluster)
+
+
+def _write(directory: str, data: bytes) -> Path:
+    path = Path(directory) / "test.mkv"
+    path.write_bytes(data)
+    return path
+
+
+def test_fixture_tracks_match_mkvmerge_ids():
+    audio, subtitles = get_all_tracks(FIXTURES / "tracks.mkv")
+
+    # mkvmerge numbers the tracks of this file from 0 in Tracks order, video included
+    assert [(t.track_number, t.mkvmerge_id) for t in audio] == [(2, 1), (3, 2)]
+    assert [(t.track_number, t.mkvmerge_id) for t in subtitles] == [(4, 3), (5, 4)]
+    assert [(t.language, t.name, t.codec, t.channels) for t in audio] == [
+        ("eng", "English 5.1", "A_AC3", 6),
+        ("rus", None, "A_AAC", 2),
+    ]
+    assert [(t.language, t.name) for t in subtitles] == [("eng", None), ("rus", "Forced")]
+
+
+def test_missing_language_is_unknown():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, _mkv(_track(1, AUDIO), _track(2, SUBTITLE, "")))
+        audio, subtitles = tracks_from_entries(read_track_entries(path))
+
+    assert audio[0].language is None
+    assert audio[0].norm_language == "unknown"
+    # Audio tracks without an Audio element get Matroska's default of one channel
+    assert audio[0].channels == 1
+    assert subtitles[0].language is None
+    assert str(subtitles[0]) == "Track 2 [unknown]"
+
+
+def test_bcp47_language_takes_precedence():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(
+            tmp,
+            _mkv(
+                _track(1, AUDIO, "und", bcp47="fi-FI"),
+                _track(2, AUDIO, bcp47="gsw"),
+                _track(3, SUBTITLE, "eng", bcp47="pt-BR"),
+            ),
+        )
+        entries = read_track_entries(path)
+
+    assert [entry.language for entry in entries] == ["fin", "gsw", "por"]
+
+
+def test_unsupported_bcp47_language_is_rejected():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, _mkv(_track(1, AUDIO, bcp47="x-klingon")))
+        try:
+            read_track_entries(path)
+        except EbmlError:
+            pass
+        else:
+            raise AssertionError("an unsupported BCP47 tag was accepted")
+
+
+def test_track_numbers_out_of_file_order_are_left_to_mkvmerge():
+    cases = {
+        "gap": (_track(1, VIDEO), _track(3, AUDIO)),
+        "reordered": (_track(2, AUDIO), _track(1, VIDEO)),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for case, tracks in cases.items():
+            path = _write(tmp, _mkv(*tracks))
+            try:
+                read_track_entries(path)
+            except EbmlError:
+                pass
+            else:
+                raise AssertionError(f"track numbers with a {case} were accepted")
+
+
+def test_elements_before_tracks_are_skipped():
+    void = _element(0xEC, b"\0" * 200)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, _mkv(_track(1, AUDIO, "jpn", channels=2), before_tracks=void))
+        entries = read_track_entries(path)
+
+    assert [(entry.number, entry.language, entry.channels) for entry in entries] == [(1, "jpn", 2)]
+
+
+def test_non_matroska_file_is_rejected():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write(tmp, b"RIFF\0\0\0\0AVI LIST")
+        try:
+            read_track_entries(path)
+        except EbmlError:
+            pass
+        else:
+            raise AssertionError("a non-Matroska file was accepted")
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from langfilter.interactive import _parse_default_track_selection, _parse_track_selection
+
+
+def test_default_selection_rejects_numbers_beyond_int_digit_limit():
+    assert _parse_default_track_selection("d" + "9" * 5000, 3) is None
+    assert _parse_default_track_selection("d2", 3) == 1
+
+
+def test_track_selection_rejects_numbers_beyond_int_digit_limit():
+    assert _parse_track_selection("1 " + "9" * 5000, 3) == (set(), False)
+    assert _parse_track_selection("1-" + "9" * 5000, 3) == (set(), False)
+    assert _parse_track_selection("1 3-4", 4) == ({0, 2, 3}, True)
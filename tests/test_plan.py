@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from langfilter.main import FileSelection, _read_plan, _write_plan
+from langfilter.parser import AudioTrack, SubtitleTrack
+
+
+def _selection(filename: Path) -> FileSelection:
+    return (
+        filename,
+        [AudioTrack(2, 1, "jpn", None, "A_FLAC", 2)],
+        [SubtitleTrack(4, 3, "eng", "Full", "S_TEXT/ASS")],
+        1,
+        None,
+    )
+
+
+def _write_files(directory: str, *names: str) -> list[Path]:
+    paths = []
+    for name in names:
+        path = (Path(directory) / name).resolve()
+        path.write_bytes(name.encode())
+        paths.append(path)
+    return paths
+
+
+def test_plan_round_trip():
+    with tempfile.TemporaryDirectory() as tmp:
+        first, second = _write_files(tmp, "ep1.mkv", "ep2.mkv")
+        selections = [_selection(first), (second, [], None, None, None)]
+        plan = Path(tmp) / "plan.json"
+        _write_plan(plan, selections, {path: path.stat() for path in (first, second)})
+
+        assert _read_plan(plan) == (selections, [])
+        # Written atomically, so no temporary file is left next to the plan
+        assert sorted(path.name for path in Path(tmp).iterdir()) == [
+            "ep1.mkv",
+            "ep2.mkv",
+            "plan.json",
+        ]
+
+
+def test_changed_and_missing_files_are_left_out():
+    with tempfile.TemporaryDirectory() as tmp:
+        resized, touched, missing, unchanged = _write_files(
+            tmp, "resized.mkv", "touched.mkv", "missing.mkv", "unchanged.mkv"
+        )
+        files = [resized, touched, missing, unchanged]
+        plan = Path(tmp) / "plan.json"
+        _write_plan(plan, [_selection(path) for path in files], {p: p.stat() for p in files})
+
+        resized.write_bytes(b"remuxed elsewhere")
+        stat = touched.stat()
+        os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        missing.unlink()
+
+        selections, changed = _read_plan(plan)
+        assert [selection[0] for selection in selections] == [unchanged]
+        assert changed == [resized, touched, missing]
+
+
+def test_unsupported_plan_version_is_rejected():
+    with tempfile.TemporaryDirectory() as tmp:
+        plan = Path(tmp) / "plan.json"
+        for version in (2, None):
+            plan.write_text(json.dumps({"version": version, "files": []}))
+            try:
+                _read_plan(plan)
+            except ValueError as e:
+                assert "unsupported plan version" in str(e)
+            else:
+                raise AssertionError(f"plan version {version!r} was accepted")